@@ -0,0 +1,22 @@
+"""
+Menu Price Optimizer - Analysis Package
+Precomputed views of the menu data for the dashboard
+"""
+
+from .aggregates import AggregateCube
+from .type_index import TypeIndex
+from .item_table import ItemTable
+from .menu_frame import MenuFrame
+from .similarity import SimilarityIndex
+from .distributions import box_summary, box_outliers, histogram_bins
+
+__all__ = [
+    'AggregateCube',
+    'TypeIndex',
+    'ItemTable',
+    'MenuFrame',
+    'SimilarityIndex',
+    'box_summary',
+    'box_outliers',
+    'histogram_bins'
+]
@@ -0,0 +1,103 @@
+"""
+Aggregate Cube
+Materialised price aggregates per restaurant × category × type × price range
+Dashboard statistics are rolled up from these cells in O(groups) instead of scanning every item
+"""
+
+import numpy as np
+
+
+class AggregateCube:
+    """
+    One cell per (restaurant, restaurant_types, price_range, category) holding
+    count / sum / min / max / sumsq of item prices - enough to derive count, mean,
+    min, max and standard deviation for any roll-up
+    """
+
+    GROUP_COLUMNS = ['restaurant', 'restaurant_types', 'price_range', 'category']
+    MEASURES = {'count': 'sum', 'sum': 'sum', 'min': 'min', 'max': 'max', 'sumsq': 'sum'}
+
+    def __init__(self, cells):
+        self.cells = cells
+
+    @classmethod
+    def from_items(cls, df):
+        """Build the cube from the item-level frame (one pass over the items)"""
+        cells = (
+            df.assign(price_sq=df['price'] ** 2)
+            .groupby(cls.GROUP_COLUMNS, observed=True, sort=False)
+            .agg(
+                count=('price', 'count'),
+                sum=('price', 'sum'),
+                min=('price', 'min'),
+                max=('price', 'max'),
+                sumsq=('price_sq', 'sum')
+            )
+            .reset_index()
+        )
+        return cls(cells)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def filter(self, restaurants=None, price_range=None, categories=None):
+        """Sub-cube for a set of restaurants (e.g. TypeIndex.restaurants), price range and/or categories"""
+        cells = self.cells
+        if restaurants is not None:
+            cells = cells[cells['restaurant'].isin(restaurants)]
+        if price_range:
+            cells = cells[cells['price_range'] == price_range]
+        if categories:
+            cells = cells[cells['category'].isin(categories)]
+        return AggregateCube(cells)
+
+    def restaurant_count(self):
+        return self.cells['restaurant'].nunique()
+
+    def values(self, column):
+        """Distinct values of a group column, in order of first appearance"""
+        return self.cells[column].unique().tolist()
+
+    def totals(self):
+        """count / sum / min / max / mean / std over the whole cube"""
+        count = self.cells['count'].sum()
+        total = self.cells['sum'].sum()
+        sumsq = self.cells['sumsq'].sum()
+        return {
+            'count': int(count),
+            'sum': total,
+            'min': self.cells['min'].min(),
+            'max': self.cells['max'].max(),
+            'mean': total / count if count else np.nan,
+            'std': float(self._std(count, total, sumsq))
+        }
+
+    def by_type(self, type_index):
+        """Per restaurant type: restaurants, count, sum, mean - one merge and groupby over the cells"""
+        merged = self.cells[['restaurant', 'count', 'sum']].merge(
+            type_index.memberships, on='restaurant'
+        )
+        grouped = merged.groupby('restaurant_type', observed=True).agg(
+            restaurants=('restaurant', 'nunique'),
+            count=('count', 'sum'),
+            sum=('sum', 'sum')
+        )
+        grouped['mean'] = grouped['sum'] / grouped['count']
+        return grouped
+
+    def rollup(self, by):
+        """Aggregate the cells by one or more group columns - count, sum, min, max, sumsq, mean, std"""
+        grouped = self.cells.groupby(by, observed=True).agg(self.MEASURES)
+        grouped['mean'] = grouped['sum'] / grouped['count']
+        grouped['std'] = self._std(grouped['count'], grouped['sum'], grouped['sumsq'])
+        return grouped
+
+    @staticmethod
+    def _std(count, total, sumsq):
+        """Sample standard deviation from count / sum / sum of squares (NaN below two items)"""
+        count = np.asarray(count, dtype=float)
+        total = np.asarray(total, dtype=float)
+        sumsq = np.asarray(sumsq, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            variance = (sumsq - total ** 2 / count) / (count - 1)
+        return np.where(count > 1, np.sqrt(np.clip(variance, 0, None)), np.nan)
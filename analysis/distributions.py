@@ -0,0 +1,52 @@
+"""
+Price Distributions
+Quantile and bin summaries of item prices, so charts receive a few numbers
+per restaurant or bin instead of every raw price
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def box_summary(df, by='restaurant'):
+    """
+    Tukey box statistics per group: count, mean, q1, median, q3 and the whiskers
+    (the most extreme prices within 1.5 IQR of the quartiles), sorted by median
+    """
+    grouped = df.groupby(by, observed=True)['price']
+    summary = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    summary.columns = ['q1', 'median', 'q3']
+    summary['count'] = grouped.count()
+    summary['mean'] = grouped.mean()
+
+    iqr = summary['q3'] - summary['q1']
+    fences = pd.DataFrame({
+        'low': summary['q1'] - 1.5 * iqr,
+        'high': summary['q3'] + 1.5 * iqr
+    })
+
+    prices = df[[by, 'price']].join(fences, on=by)
+    inside = prices[(prices['price'] >= prices['low']) & (prices['price'] <= prices['high'])]
+    whiskers = inside.groupby(by, observed=True)['price'].agg(['min', 'max'])
+    summary['lowerfence'] = whiskers['min']
+    summary['upperfence'] = whiskers['max']
+
+    return summary.sort_values('median', ascending=False)
+
+
+def box_outliers(df, summary, by='restaurant', top_n=20):
+    """The top_n items furthest outside their group's whiskers"""
+    prices = df[[by, 'item_name', 'price']].join(summary[['lowerfence', 'upperfence']], on=by)
+    distance = np.maximum(prices['lowerfence'] - prices['price'], prices['price'] - prices['upperfence'])
+    outliers = prices.assign(distance=distance)
+    outliers = outliers[outliers['distance'] > 0]
+    return outliers.nlargest(top_n, 'distance')[[by, 'item_name', 'price']]
+
+
+def histogram_bins(prices, bins=15):
+    """Equal-width price bins: bin_start, bin_end and count per bin"""
+    prices = np.asarray(prices, dtype=float)
+    if len(prices) == 0:
+        return pd.DataFrame(columns=['bin_start', 'bin_end', 'count'])
+    counts, edges = np.histogram(prices, bins=bins)
+    return pd.DataFrame({'bin_start': edges[:-1], 'bin_end': edges[1:], 'count': counts})
@@ -0,0 +1,60 @@
+"""
+Item Table
+Server-side search, sort and paging for the competitor item table,
+so only the visible page is sent to the browser
+"""
+
+import numpy as np
+
+
+class ItemTable:
+    """
+    Menu items stored once sorted by price (high to low), plus a precomputed row
+    permutation per sort order - a page request is a mask and a slice, never a sort
+    """
+
+    COLUMNS = ['restaurant', 'item_name', 'category', 'price']
+
+    # Sort label -> (column, ascending)
+    SORTS = {
+        'Price: high to low': ('price', False),
+        'Price: low to high': ('price', True),
+        'Restaurant A-Z': ('restaurant', True),
+        'Item A-Z': ('item_name', True)
+    }
+
+    def __init__(self, df):
+        self.items = df[self.COLUMNS].sort_values('price', ascending=False, kind='stable').reset_index(drop=True)
+        self._search_text = (
+            self.items['restaurant'].astype(str) + ' ' + self.items['item_name'].astype(str)
+        ).str.lower()
+
+        self._orders = {}
+        for label, (column, ascending) in self.SORTS.items():
+            if column == 'price' and not ascending:
+                order = np.arange(len(self.items))
+            else:
+                values = self.items[column]
+                keys = values.to_numpy() if column == 'price' else values.astype(str).str.lower().to_numpy()
+                # Stable, so ties stay in price order
+                order = np.argsort(keys, kind='stable')
+            self._orders[label] = order
+
+    def __len__(self):
+        return len(self.items)
+
+    def select(self, categories=None, search='', sort='Price: high to low'):
+        """Row positions matching the filters, in the requested sort order"""
+        mask = np.ones(len(self.items), dtype=bool)
+        if categories:
+            mask &= self.items['category'].isin(categories).to_numpy()
+        if search:
+            mask &= self._search_text.str.contains(search.strip().lower(), regex=False).to_numpy()
+
+        order = self._orders[sort]
+        return order[mask[order]]
+
+    def page(self, positions, page=1, page_size=50):
+        """The rows for one page of a selection"""
+        start = (page - 1) * page_size
+        return self.items.iloc[positions[start:start + page_size]]
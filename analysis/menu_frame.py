@@ -0,0 +1,58 @@
+"""
+Menu Frame
+In-memory query interface over the item-level DataFrame - the same methods as
+storage.MenuDatabase, so dashboard tabs work against either backend
+"""
+
+from .aggregates import AggregateCube
+from .distributions import box_summary, box_outliers, histogram_bins
+from .item_table import ItemTable
+
+
+class MenuFrame:
+    """Dashboard queries answered from a DataFrame held in the Streamlit process"""
+
+    def __init__(self, df):
+        self.df = df
+        self._item_table = None
+
+    def categories(self):
+        """All item categories, sorted"""
+        return sorted(self.df['category'].astype(str).unique().tolist())
+
+    def items(self, categories=None, restaurants=None, price_range=None, columns=None):
+        """Items matching the filters (only the requested columns)"""
+        df = self.df
+        if categories:
+            df = df[df['category'].isin(categories)]
+        if restaurants is not None:
+            df = df[df['restaurant'].isin(restaurants)]
+        if price_range:
+            df = df[df['price_range'] == price_range]
+        return df[[c for c in columns if c in df.columns]] if columns else df
+
+    def price_stats(self, categories=None):
+        """count / mean / min / max of item prices for a category selection"""
+        prices = self.items(categories=categories)['price']
+        return {'count': len(prices), 'mean': prices.mean(), 'min': prices.min(), 'max': prices.max()}
+
+    def price_boxes(self, categories=None, top_n=20):
+        """Box statistics per restaurant (sorted by median) and the top_n items furthest outside the whiskers"""
+        items = self.items(categories=categories, columns=['restaurant', 'item_name', 'price'])
+        summary = box_summary(items)
+        return summary, box_outliers(items, summary, top_n=top_n)
+
+    def histogram(self, restaurants=None, price_range=None, bins=15):
+        """Equal-width price bins of the filtered items"""
+        return histogram_bins(self.items(restaurants=restaurants, price_range=price_range)['price'], bins=bins)
+
+    def cube_cells(self):
+        """Cells of AggregateCube"""
+        return AggregateCube.from_items(self.df).cells
+
+    def item_page(self, categories=None, search='', sort='Price: high to low', page=1, page_size=50):
+        """One page of items for the competitor table, plus the total number of matches"""
+        if self._item_table is None:
+            self._item_table = ItemTable(self.df)
+        positions = self._item_table.select(categories, search, sort)
+        return self._item_table.page(positions, page, page_size), len(positions)
@@ -0,0 +1,95 @@
+"""
+Similarity Index
+TF-IDF over character n-grams of item names (and descriptions) for like-for-like
+competitor matching - "Cappuccino" finds cappuccinos, whatever category a restaurant filed them under
+"""
+
+import re
+from collections import Counter
+
+import numpy as np
+
+
+class SimilarityIndex:
+    """
+    L2-normalised TF-IDF vectors stored as an inverted index (n-gram -> items, weights),
+    so a query only touches items that share an n-gram with it
+    """
+
+    NGRAM_SIZE = 3
+    # Description n-grams count for less than name n-grams
+    DESCRIPTION_WEIGHT = 0.5
+
+    def __init__(self, items, descriptions=None):
+        self.items = items.reset_index(drop=True)
+        self._vocabulary = {}
+
+        names = self.items['item_name'].fillna('').astype(str).tolist()
+        descriptions = (
+            descriptions.fillna('').astype(str).tolist() if descriptions is not None else [''] * len(names)
+        )
+
+        rows, columns, values = [], [], []
+        for row, (name, description) in enumerate(zip(names, descriptions)):
+            terms = self._term_weights(name)
+            for gram, weight in self._term_weights(description).items():
+                terms[gram] = terms.get(gram, 0) + self.DESCRIPTION_WEIGHT * weight
+            for gram, weight in terms.items():
+                rows.append(row)
+                columns.append(self._vocabulary.setdefault(gram, len(self._vocabulary)))
+                values.append(weight)
+
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+
+        document_frequency = np.bincount(columns, minlength=len(self._vocabulary))
+        self._idf = np.log((1 + len(names)) / (1 + document_frequency)) + 1
+
+        values = values * self._idf[columns]
+        norms = np.sqrt(np.bincount(rows, weights=values ** 2, minlength=len(names)))
+        values = values / norms[rows]
+
+        # Postings sorted by n-gram: items and weights for n-gram g live in offsets[g]:offsets[g + 1]
+        order = np.argsort(columns, kind='stable')
+        self._posting_items = rows[order]
+        self._posting_weights = values[order]
+        self._offsets = np.concatenate([[0], np.cumsum(document_frequency)])
+
+    @classmethod
+    def _ngrams(cls, text):
+        text = ' ' + re.sub(r'[\W_]+', ' ', text.lower()).strip() + ' '
+        return [text[i:i + cls.NGRAM_SIZE] for i in range(len(text) - cls.NGRAM_SIZE + 1)] if text.strip() else []
+
+    @classmethod
+    def _term_weights(cls, text):
+        """Sublinear term frequency (1 + log count) per n-gram"""
+        return {gram: 1 + np.log(count) for gram, count in Counter(cls._ngrams(text)).items()}
+
+    def __len__(self):
+        return len(self.items)
+
+    def query(self, text, k=25, min_similarity=0.0):
+        """The k items most similar to the text (cosine similarity, best first) with a 'similarity' column"""
+        scores = np.zeros(len(self.items))
+        weights = {
+            self._vocabulary[gram]: weight
+            for gram, weight in self._term_weights(text).items()
+            if gram in self._vocabulary
+        }
+        if not weights:
+            return self.items.iloc[[]].assign(similarity=[])
+
+        query_weights = np.array(list(weights.values())) * self._idf[list(weights)]
+        query_weights /= np.linalg.norm(query_weights)
+
+        for gram, weight in zip(weights, query_weights):
+            start, end = self._offsets[gram], self._offsets[gram + 1]
+            scores[self._posting_items[start:end]] += weight * self._posting_weights[start:end]
+
+        candidates = np.flatnonzero(scores > min_similarity)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+        return self.items.iloc[candidates].assign(similarity=scores[candidates])
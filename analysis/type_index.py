@@ -0,0 +1,42 @@
+"""
+Type Index
+Normalised restaurant-type membership, so type filters are exact lookups
+instead of substring scans over the 'pizza, italian' strings
+"""
+
+
+class TypeIndex:
+    """Long table with one (restaurant, restaurant_type) row per type a restaurant has"""
+
+    def __init__(self, memberships):
+        self.memberships = memberships
+        self._by_type = {
+            str(rtype): restaurants.tolist()
+            for rtype, restaurants in memberships.groupby('restaurant_type', observed=True)['restaurant']
+        }
+
+    @classmethod
+    def from_items(cls, df):
+        """Explode each restaurant's comma-separated types (one pass over restaurants, not items)"""
+        restaurants = df[['restaurant', 'restaurant_types']].drop_duplicates('restaurant')
+        memberships = (
+            restaurants.assign(restaurant_type=restaurants['restaurant_types'].astype(str).str.split(','))
+            .explode('restaurant_type')
+        )
+        memberships['restaurant_type'] = memberships['restaurant_type'].str.strip().str.lower()
+        memberships = memberships[memberships['restaurant_type'] != ''][['restaurant', 'restaurant_type']]
+        memberships = memberships.drop_duplicates().reset_index(drop=True)
+        memberships['restaurant_type'] = memberships['restaurant_type'].astype('category')
+        return cls(memberships)
+
+    def types(self):
+        """All restaurant types, sorted"""
+        return sorted(self._by_type)
+
+    def restaurants(self, restaurant_type):
+        """Restaurants that have exactly this type"""
+        return self._by_type.get(restaurant_type.lower(), [])
+
+    def restaurant_counts(self):
+        """Number of restaurants per type"""
+        return self.memberships.groupby('restaurant_type', observed=True)['restaurant'].nunique()
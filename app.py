@@ -5,12 +5,14 @@ MVP for cafes and restaurants to optimize their pricing
 
 import streamlit as st
 import pandas as pd
-import json
 import plotly.express as px
 import plotly.graph_objects as go
 import anthropic
+import asyncio
 import os
 import sys
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 
 # Add scrapers to path
@@ -18,6 +20,10 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 # Import scraper manager
 from scraper_manager import ScraperManager
+from storage import JobJournal, RestaurantStore, MenuDatabase, ResponseCache
+from scrapers.dedup import normalize_item_name
+from storage.menu_dataset import columnar_available, dataset_is_current, write_menu_dataset, read_menu_dataset
+from analysis import AggregateCube, TypeIndex, ItemTable, MenuFrame, SimilarityIndex
 
 # Page config
 st.set_page_config(
@@ -238,34 +244,82 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Load scraped data
-@st.cache_data
-def load_data():
-    with open('scraped_menus.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+DASHBOARD_COLUMNS = ['restaurant', 'restaurant_types', 'price_range', 'item_name', 'category', 'price']
+
+# Where dashboard queries run: 'memory' (items held in the Streamlit process) or
+# 'sqlite' (indexed scraped_menus.db - filters and aggregates run as SQL, memory stays flat)
+DATA_BACKEND = os.environ.get('MENU_DATA_BACKEND', 'memory')
+
+# Raw points drawn on the competitor box plot, and how many category selections keep their summary cached
+OUTLIER_LIMIT = 20
+PRICE_SUMMARY_CACHE = 8
+
+# Like-for-like matching: nearest competitor items by name and how close they must be
+SIMILAR_ITEMS = 25
+MIN_SIMILARITY = 0.3
+
+# AI recommendations: model, and how long identical requests are answered from ai_responses.db
+AI_MODEL = "claude-sonnet-4-20250514"
+AI_CACHE_TTL = 7 * 24 * 3600
+AI_CACHE_ENTRIES = 500
+
+def data_version():
+    """Stat signature of the scraped data files - changes exactly when the data on disk changes"""
+    version = []
+    for path in ('scraped_menus.jsonl', 'scraped_menus.json'):
+        try:
+            stat = os.stat(path)
+            version.append((path, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            version.append((path, None, None))
+    return tuple(version)
+
+# data_version is only the cache key: a new scrape changes it and forces a reload
+@st.cache_data(max_entries=1)
+def load_data(data_version):
+    # SQLite backend: no item frame in the process, only the type index and counts
+    if DATA_BACKEND == 'sqlite':
+        database = load_database(data_version)
+        return None, TypeIndex(database.type_memberships()), database.metadata()
+
+    # Stream restaurants from the JSONL store (imported from scraped_menus.json on first use, or when that is newer)
+    store = RestaurantStore('scraped_menus.jsonl')
+    if not store.exists():
+        raise FileNotFoundError('scraped_menus.jsonl')
+
+    if columnar_available():
+        # Columnar copy: memory-mapped, only the columns the dashboard uses, categoricals pre-encoded
+        if not dataset_is_current('scraped_menus.parquet', store.path):
+            write_menu_dataset(store.latest(), 'scraped_menus.parquet')
+        df, total_restaurants = read_menu_dataset('scraped_menus.parquet', columns=DASHBOARD_COLUMNS)
+    else:
+        total_restaurants = 0
+
+        # Convert to DataFrame
+        rows = []
+        for restaurant in store.latest():
+            total_restaurants += 1
+            restaurant_types = ', '.join(restaurant.get('restaurant_types', ['restaurant']))
+            price_range = restaurant.get('price_range', 'unknown')
+
+            for item in restaurant['menu_items']:
+                rows.append({
+                    'restaurant': restaurant['restaurant_name'],
+                    'restaurant_types': restaurant_types,
+                    'price_range': price_range,
+                    'item_name': item['name'],
+                    'category': item['category'],
+                    'price': item['price']
+                })
+
+        df = pd.DataFrame(rows, columns=DASHBOARD_COLUMNS)
 
-    total_restaurants = len(data)
-    
-    # Convert to DataFrame
-    rows = []
-    for restaurant in data:
-        restaurant_types = ', '.join(restaurant.get('restaurant_types', ['restaurant']))
-        price_range = restaurant.get('price_range', 'unknown')
-
-        for item in restaurant['menu_items']:
-            rows.append({
-                'restaurant': restaurant['restaurant_name'],
-                'restaurant_types': restaurant_types,
-                'price_range': price_range,
-                'item_name': item['name'],
-                'category': item['category'],
-                'price': item['price']
-            })
-
-    df = pd.DataFrame(rows)
     restaurants_before_filter = df['restaurant'].nunique() if len(df) > 0 else 0
     
     # Filter out zero prices
-    df = df[df['price'] > 0]
+    df = df[df['price'] > 0].copy()
+    for column in df.select_dtypes('category').columns:
+        df[column] = df[column].cat.remove_unused_categories()
     restaurants_after_filter = df['restaurant'].nunique() if len(df) > 0 else 0
     
     # Calculate metadata
@@ -275,23 +329,180 @@ def load_data():
         'with_valid_prices': restaurants_after_filter,
         'filtered_out': total_restaurants - restaurants_after_filter
     }
-    
-    return df, metadata
 
-# Initialize Claude client
+    # Exact restaurant -> type membership for type filters and breakdowns
+    type_index = TypeIndex.from_items(df)
+    
+    return df, type_index, metadata
+
+# Type index and counts every rerun needs - a shared object, so a rerun doesn't unpickle the item frame
+@st.cache_resource(max_entries=1)
+def load_overview(data_version):
+    _, type_index, metadata = load_data(data_version)
+    return type_index, metadata
+
+# One row per stored restaurant for the Data Collection tab - streamed from the JSONL store
+@st.cache_data(max_entries=1)
+def load_store_summary(data_version):
+    store = RestaurantStore('scraped_menus.jsonl')
+    if not store.exists():
+        raise FileNotFoundError('scraped_menus.jsonl')
+    rows = [
+        {
+            'Restaurant': restaurant['restaurant_name'],
+            'Items': len(restaurant.get('menu_items', [])),
+            'Types': ', '.join(restaurant.get('restaurant_types', [])),
+            'Price Range': restaurant.get('price_range', 'unknown'),
+            'Scraped At': restaurant.get('scraped_at', '')
+        }
+        for restaurant in store.latest()
+    ]
+    return pd.DataFrame(rows, columns=['Restaurant', 'Items', 'Types', 'Price Range', 'Scraped At'])
+
+# Progress of an interrupted scrape job - the journal is only replayed when it changes
+@st.cache_data(max_entries=1)
+def load_job_summary(job_signature):
+    job_state = JobJournal(job_signature[0]).load()
+    job_total = len(job_state['urls']) if job_state['urls'] is not None else '?'
+    return job_state['params'].get('city', '?'), len(job_state['results']), job_total
+
+# Indexed SQLite copy of the menu items, rebuilt from the JSONL store whenever that is newer
+@st.cache_resource(max_entries=1)
+def load_database(data_version):
+    store = RestaurantStore('scraped_menus.jsonl')
+    if not store.exists():
+        raise FileNotFoundError('scraped_menus.jsonl')
+    database = MenuDatabase('scraped_menus.db')
+    if not dataset_is_current(database.path, store.path) or not database.schema_is_current():
+        return MenuDatabase.build(store.latest(), database.path)
+    return database
+
+# Query interface the tabs use - same methods for both backends; shared, not copied per rerun
+@st.cache_resource(max_entries=1)
+def load_menu(data_version):
+    if DATA_BACKEND == 'sqlite':
+        return load_database(data_version)
+    df, _, _ = load_data(data_version)
+    return MenuFrame(df)
+
+# Aggregate cube for the Market Overview - built once per dataset version
+@st.cache_data(max_entries=1)
+def load_cube(data_version):
+    return AggregateCube(load_menu(data_version).cube_cells())
+
+# Item name/description similarity index for like-for-like competitor matching
+@st.cache_resource(max_entries=1)
+def load_similarity_index(data_version):
+    # SQLite backend: the index stays on disk, queries read only their n-grams' postings
+    if DATA_BACKEND == 'sqlite':
+        return load_database(data_version).similarity_index()
+
+    df, _, _ = load_data(data_version)
+    descriptions = None
+    if columnar_available():
+        # Same file and filter as load_data, so rows line up
+        described, _ = read_menu_dataset('scraped_menus.parquet', columns=['description', 'price'])
+        described = described[described['price'] > 0]
+        if len(described) == len(df):
+            descriptions = described['description']
+    return SimilarityIndex(df[['restaurant', 'item_name', 'category', 'price']], descriptions)
+
+# Per-restaurant box statistics for a category selection, plus its most extreme items
+# (a few recent selections are kept)
+@st.cache_data(max_entries=PRICE_SUMMARY_CACHE)
+def load_price_summary(data_version, categories):
+    return load_menu(data_version).price_boxes(categories=list(categories), top_n=OUTLIER_LIMIT)
+
+# Competitor set for an item: its nearest matches by name, or a whole category
+def select_competitor_items(menu, similarity_index, item_name, key, help_text):
+    """Returns (competitor items, label describing what they are compared on)"""
+    compare_mode = st.radio("Compare against", ["Similar items", "Category"], horizontal=True,
+                            key=f"{key}_mode", help="Similar items matches competitor items by name and description")
+
+    if compare_mode == "Category":
+        category = st.selectbox("Category", menu.categories(), key=key, help=help_text)
+        return menu.items(categories=[category]), category
+
+    matches = similarity_index.query(item_name, k=SIMILAR_ITEMS, min_similarity=MIN_SIMILARITY)
+    if len(matches) > 0:
+        with st.expander(f"🔎 {len(matches)} similar competitor items"):
+            st.dataframe(matches, column_config=table_formats(euro=['price'], number=['similarity']),
+                         use_container_width=True, hide_index=True)
+    else:
+        st.info(f"No competitor items similar to '{item_name}' - try another name or compare by category.")
+    return matches, f"Items similar to {item_name}"
+
+# Table display formats - columns stay numeric (so they sort numerically) and are
+# formatted by Streamlit in the browser instead of per cell in Python
+def table_formats(euro=(), number=(), percent=(), integer=()):
+    """column_config for st.dataframe: euro amounts, plain 2-decimal numbers, percentages, counts (euros and counts with thousands separators - Streamlit's format presets)"""
+    config = {}
+    for column in euro:
+        config[column] = st.column_config.NumberColumn(column, format="euro")
+    for column in number:
+        config[column] = st.column_config.NumberColumn(column, format="%.2f")
+    for column in percent:
+        config[column] = st.column_config.NumberColumn(column, format="%.1f%%")
+    for column in integer:
+        config[column] = st.column_config.NumberColumn(column, format="localized")
+    return config
+
+# Initialize Claude client: async, on an event loop in a background thread, so requests never block a script run
 @st.cache_resource
-def get_claude_client():
+def get_ai_runner():
     api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if api_key:
-        return anthropic.Anthropic(api_key=api_key)
-    return None
+    if not api_key:
+        return None, None
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="ai-requests", daemon=True).start()
+    return anthropic.AsyncAnthropic(api_key=api_key), loop
+
+# Answers to earlier identical requests, shared by all sessions and kept across restarts
+@st.cache_resource
+def get_ai_cache():
+    return ResponseCache('ai_responses.db', ttl_seconds=AI_CACHE_TTL, max_entries=AI_CACHE_ENTRIES)
+
+# Runs on the event-loop thread, which has no Streamlit script context - it gets the cache passed in
+async def fetch_ai_recommendations(client, prompt, cache, cache_key):
+    try:
+        message = await client.messages.create(
+            model=AI_MODEL,
+            max_tokens=500,
+            messages=[{"role": "user", "content": prompt}]
+        )
+    except Exception as e:
+        return f"Error generating recommendations: {str(e)}"
 
-def get_ai_recommendations(item_name, your_price, ingredient_cost, competitor_data, category):
-    """Generate AI recommendations using Claude"""
-    client = get_claude_client()
+    # Only successful answers are cached
+    recommendations = message.content[0].text
+    cache.put(cache_key, recommendations)
+    return recommendations
+
+def get_ai_recommendations(item_name, your_price, ingredient_cost, competitor_data, category, data_version):
+    """
+    Start Claude recommendations in the background
+    Returns (future, cached) - the future is already resolved when identical inputs were answered before
+    """
+    client, loop = get_ai_runner()
 
     if not client:
-        return None
+        return None, False
+
+    cache_key = ResponseCache.key(
+        model=AI_MODEL,
+        item=normalize_item_name(item_name),
+        price=round(your_price, 2),
+        cost=round(ingredient_cost, 2),
+        category=category,
+        competitors=competitor_data['price'].round(2).sort_values().tolist(),
+        data_version=data_version
+    )
+    cache = get_ai_cache()
+    cached = cache.get(cache_key)
+    if cached is not None:
+        future = Future()
+        future.set_result(cached)
+        return future, True
 
     # Prepare context
     profit_margin = ((your_price - ingredient_cost) / your_price) * 100
@@ -319,15 +530,14 @@ Provide:
 
 Keep it concise and practical. Format as bullet points."""
 
-    try:
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=500,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return message.content[0].text
-    except Exception as e:
-        return f"Error generating recommendations: {str(e)}"
+    return asyncio.run_coroutine_threadsafe(fetch_ai_recommendations(client, prompt, cache, cache_key), loop), False
+
+# Polls a pending AI request without rerunning the page; reruns it once the answer is in
+@st.fragment(run_every=1)
+def wait_for_ai_recommendations(future):
+    if future.done():
+        st.rerun()
+    st.info("🧠 Analyzing your pricing with Claude AI... the rest of the dashboard stays usable meanwhile.")
 
 # Header
 st.markdown('<p class="main-header">💰 Menu Price Optimizer</p>', unsafe_allow_html=True)
@@ -335,7 +545,10 @@ st.markdown('<p class="sub-header">Data-driven pricing for cafes and restaurants
 
 # Load data
 try:
-    df, metadata = load_data()
+    current_version = data_version()
+    type_index, metadata = load_overview(current_version)
+    menu = load_menu(current_version)
+    cube = load_cube(current_version)
 
     # Better navigation with tabs instead of sidebar radio
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
@@ -383,14 +596,16 @@ try:
         # Key metrics
         col1, col2, col3, col4 = st.columns(4)
 
+        market_totals = cube.totals()
+
         with col1:
-            st.metric("🏪 Restaurants", df['restaurant'].nunique())
+            st.metric("🏪 Restaurants", cube.restaurant_count())
         with col2:
-            st.metric("📋 Menu Items", len(df))
+            st.metric("📋 Menu Items", market_totals['count'])
         with col3:
-            st.metric("💰 Avg Price", f"€{df['price'].mean():.2f}")
+            st.metric("💰 Avg Price", f"€{market_totals['mean']:.2f}")
         with col4:
-            st.metric("📊 Price Range", f"€{df['price'].min():.2f} - €{df['price'].max():.2f}")
+            st.metric("📊 Price Range", f"€{market_totals['min']:.2f} - €{market_totals['max']:.2f}")
 
         st.markdown("---")
 
@@ -398,9 +613,7 @@ try:
         st.markdown("#### 🏷️ Categories Overview")
         st.markdown("Quick view of all menu categories and their average prices")
 
-        category_stats_for_grid = df.groupby('category').agg({
-            'price': ['mean', 'count']
-        }).round(2)
+        category_stats_for_grid = cube.rollup('category')[['mean', 'count']].round(2)
         category_stats_for_grid.columns = ['avg_price', 'count']
         category_stats_for_grid = category_stats_for_grid.reset_index().sort_values('avg_price', ascending=False)
 
@@ -431,10 +644,7 @@ try:
         col1, col2, col3 = st.columns(3)
         with col1:
             # Restaurant types filter
-            all_types = set()
-            for types_str in df['restaurant_types'].unique():
-                all_types.update([t.strip() for t in types_str.split(',')])
-            all_types = sorted(list(all_types))
+            all_types = type_index.types()
 
             selected_type = st.selectbox(
                 "🍽️ Restaurant Type",
@@ -445,7 +655,7 @@ try:
 
         with col2:
             # Price range filter
-            price_ranges = ['All'] + sorted(df['price_range'].unique().tolist())
+            price_ranges = ['All'] + sorted(cube.values('price_range'))
             selected_price_range = st.selectbox(
                 "💰 Price Range",
                 price_ranges,
@@ -462,24 +672,20 @@ try:
                 if selected_price_range != 'All':
                     st.success(f"✓ {selected_price_range}")
 
-        # Apply filters
-        filtered_overview_df = df.copy()
-        if selected_type != 'All Types':
-            filtered_overview_df = filtered_overview_df[
-                filtered_overview_df['restaurant_types'].str.contains(selected_type, case=False, na=False)
-            ]
-        if selected_price_range != 'All':
-            filtered_overview_df = filtered_overview_df[
-                filtered_overview_df['price_range'] == selected_price_range
-            ]
-
-        if len(filtered_overview_df) == 0:
+        # Apply filters (to the cube - the item frame is only filtered for the histogram)
+        filter_type = selected_type if selected_type != 'All Types' else None
+        filter_price_range = selected_price_range if selected_price_range != 'All' else None
+        filter_restaurants = type_index.restaurants(filter_type) if filter_type else None
+        filtered_cube = cube.filter(restaurants=filter_restaurants, price_range=filter_price_range)
+
+        if len(filtered_cube) == 0:
             st.warning(f"⚠️ No restaurants match your filters ({selected_type}, {selected_price_range}). Showing all data instead.")
-            filtered_overview_df = df  # Fallback to show all data
+            filtered_cube = cube  # Fallback to show all data
+            filter_restaurants = filter_price_range = None
         else:
             # Show filtered stats
-            filtered_restaurants = filtered_overview_df['restaurant'].nunique()
-            total_restaurants = df['restaurant'].nunique()
+            filtered_restaurants = filtered_cube.restaurant_count()
+            total_restaurants = cube.restaurant_count()
             if selected_type != 'All Types' or selected_price_range != 'All':
                 st.info(f"📊 Showing **{filtered_restaurants}** of **{total_restaurants}** restaurants matching your filters")
 
@@ -489,23 +695,13 @@ try:
         st.markdown("See the competitive landscape by restaurant type in your market")
 
         # Calculate restaurant type stats
-        type_breakdown = []
-        for types_str in df['restaurant_types'].unique():
-            for rtype in types_str.split(','):
-                rtype = rtype.strip()
-                type_df = df[df['restaurant_types'].str.contains(rtype, case=False, na=False)]
-                type_restaurants = type_df['restaurant'].nunique()
-                type_items = len(type_df)
-                type_avg_price = type_df['price'].mean()
-                type_breakdown.append({
-                    'Type': rtype.title(),
-                    'Restaurants': type_restaurants,
-                    'Menu Items': type_items,
-                    'Avg Price': type_avg_price
-                })
-
-        # Remove duplicates and sort
-        type_breakdown_df = pd.DataFrame(type_breakdown).drop_duplicates('Type').sort_values('Restaurants', ascending=False)
+        type_stats = cube.by_type(type_index)
+        type_breakdown_df = pd.DataFrame({
+            'Type': [str(rtype).title() for rtype in type_stats.index],
+            'Restaurants': type_stats['restaurants'].values,
+            'Menu Items': type_stats['count'].values,
+            'Avg Price': type_stats['mean'].values
+        }).sort_values('Restaurants', ascending=False)
 
         col1, col2 = st.columns([2, 1])
 
@@ -535,10 +731,10 @@ try:
 
             st.markdown("---")
             st.markdown("**Example: Asian Restaurants**")
-            asian_df = df[df['restaurant_types'].str.contains('asian', case=False, na=False)]
-            if len(asian_df) > 0:
-                asian_restaurants = asian_df['restaurant'].nunique()
-                asian_avg = asian_df['price'].mean()
+            asian_cube = cube.filter(restaurants=type_index.restaurants('asian'))
+            if len(asian_cube) > 0:
+                asian_restaurants = asian_cube.restaurant_count()
+                asian_avg = asian_cube.totals()['mean']
                 st.metric("Asian Restaurants", asian_restaurants)
                 st.metric("Avg Price", f"€{asian_avg:.2f}")
             else:
@@ -550,24 +746,17 @@ try:
         st.markdown("Complete list of restaurants with pricing data")
 
         # Create restaurant summary
-        restaurant_summary = df.groupby('restaurant').agg({
-            'item_name': 'count',
-            'price': ['mean', 'min', 'max'],
-            'restaurant_types': 'first',
-            'price_range': 'first'
-        }).reset_index()
+        restaurant_summary = cube.rollup(['restaurant', 'restaurant_types', 'price_range'])
+        restaurant_summary = restaurant_summary[['count', 'mean', 'min', 'max']].reset_index()
+        restaurant_summary = restaurant_summary[['restaurant', 'count', 'mean', 'min', 'max', 'restaurant_types', 'price_range']]
 
         restaurant_summary.columns = ['Restaurant', 'Menu Items', 'Avg Price', 'Min Price', 'Max Price', 'Types', 'Price Range']
         restaurant_summary = restaurant_summary.sort_values('Restaurant')
 
-        # Format pricing columns
-        restaurant_summary['Avg Price'] = restaurant_summary['Avg Price'].apply(lambda x: f"€{x:.2f}")
-        restaurant_summary['Min Price'] = restaurant_summary['Min Price'].apply(lambda x: f"€{x:.2f}")
-        restaurant_summary['Max Price'] = restaurant_summary['Max Price'].apply(lambda x: f"€{x:.2f}")
-
         # Display table
         st.dataframe(
             restaurant_summary,
+            column_config=table_formats(euro=['Avg Price', 'Min Price', 'Max Price']),
             use_container_width=True,
             hide_index=True,
             height=min(len(restaurant_summary) * 40 + 50, 400)  # Dynamic height, max 400px
@@ -578,7 +767,7 @@ try:
         with col1:
             st.metric("📍 Total Restaurants", len(restaurant_summary))
         with col2:
-            total_items = df['item_name'].count()
+            total_items = market_totals['count']
             st.metric("📋 Total Menu Items", total_items)
         with col3:
             avg_items_per_restaurant = total_items / len(restaurant_summary)
@@ -591,15 +780,23 @@ try:
 
         with col1:
             st.markdown("#### Price Distribution")
-            fig = px.histogram(filtered_overview_df, x='price', nbins=15,
-                             labels={'price': 'Price (€)', 'count': 'Number of Items'},
-                             color_discrete_sequence=['#667eea'])
-            fig.update_layout(showlegend=False, height=400)
+            # Bin server-side - the chart gets 15 bars, not every price
+            bins = menu.histogram(restaurants=filter_restaurants, price_range=filter_price_range, bins=15)
+            fig = go.Figure(go.Bar(
+                x=(bins['bin_start'] + bins['bin_end']) / 2,
+                y=bins['count'],
+                width=bins['bin_end'] - bins['bin_start'],
+                customdata=bins[['bin_start', 'bin_end']],
+                hovertemplate='€%{customdata[0]:.2f} - €%{customdata[1]:.2f}<br>%{y} items<extra></extra>',
+                marker_color='#667eea'
+            ))
+            fig.update_layout(showlegend=False, height=400, bargap=0,
+                              xaxis_title='Price (€)', yaxis_title='Number of Items')
             st.plotly_chart(fig, use_container_width=True)
 
         with col2:
             st.markdown("#### Average Price by Restaurant")
-            restaurant_avg = filtered_overview_df.groupby('restaurant')['price'].mean().sort_values(ascending=False)
+            restaurant_avg = filtered_cube.rollup('restaurant')['mean'].sort_values(ascending=False)
             fig = px.bar(x=restaurant_avg.values, y=restaurant_avg.index,
                         orientation='h',
                         labels={'x': 'Average Price (€)', 'y': ''},
@@ -614,13 +811,8 @@ try:
 
         with col1:
             # Count by type
-            type_counts = {}
-            for types_str in df['restaurant_types'].unique():
-                for t in types_str.split(','):
-                    t = t.strip()
-                    type_counts[t] = type_counts.get(t, 0) + 1
-
-            type_df = pd.DataFrame(list(type_counts.items()), columns=['Type', 'Count'])
+            type_counts = type_index.restaurant_counts()
+            type_df = pd.DataFrame({'Type': type_counts.index.astype(str), 'Count': type_counts.values})
             type_df = type_df.sort_values('Count', ascending=False)
 
             fig = px.bar(type_df, x='Type', y='Count',
@@ -632,7 +824,7 @@ try:
 
         with col2:
             # Price range distribution
-            price_range_counts = df.groupby('price_range')['restaurant'].nunique()
+            price_range_counts = cube.cells.groupby('price_range', observed=True)['restaurant'].nunique()
             fig = px.pie(values=price_range_counts.values, names=price_range_counts.index,
                         title='Restaurants by Price Range',
                         color_discrete_sequence=px.colors.sequential.RdBu)
@@ -641,9 +833,7 @@ try:
 
         # Category breakdown
         st.markdown("#### Prices by Category")
-        category_stats = filtered_overview_df.groupby('category').agg({
-            'price': ['mean', 'min', 'max', 'count']
-        }).round(2)
+        category_stats = filtered_cube.rollup('category')[['mean', 'min', 'max', 'count']].round(2)
         category_stats.columns = ['Avg Price (€)', 'Min Price (€)', 'Max Price (€)', 'Items']
         category_stats = category_stats.sort_values('Avg Price (€)', ascending=False)
         st.dataframe(category_stats, use_container_width=True)
@@ -669,7 +859,7 @@ try:
         st.markdown("---")
 
         # Multi-select for categories
-        all_categories = sorted(df['category'].unique().tolist())
+        all_categories = menu.categories()
         selected_categories = st.multiselect(
             "🏷️ Select Categories to Analyze",
             all_categories,
@@ -678,35 +868,81 @@ try:
             help="Choose one or more categories to see detailed pricing analysis"
         )
 
-        if selected_categories:
-            filtered_df = df[df['category'].isin(selected_categories)]
-        else:
-            filtered_df = df
+        if not selected_categories:
             st.info("💡 Select at least one category to view specific analysis, or leave empty to see all items.")
 
         # Show stats
+        category_stats = menu.price_stats(selected_categories)
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("📦 Items", len(filtered_df))
+            st.metric("📦 Items", category_stats['count'])
         with col2:
-            st.metric("💰 Average Price", f"€{filtered_df['price'].mean():.2f}")
+            st.metric("💰 Average Price", f"€{category_stats['mean']:.2f}")
         with col3:
-            st.metric("📊 Price Range", f"€{filtered_df['price'].min():.2f} - €{filtered_df['price'].max():.2f}")
+            st.metric("📊 Price Range", f"€{category_stats['min']:.2f} - €{category_stats['max']:.2f}")
 
         st.markdown("---")
 
-        # Detailed table
+        # Detailed table - searched, sorted and paged server-side, only the visible page is sent
         st.markdown("#### All Items in Category")
-        display_df = filtered_df[['restaurant', 'item_name', 'category', 'price']].sort_values('price', ascending=False)
-        display_df['price'] = display_df['price'].apply(lambda x: f"€{x:.2f}")
-        st.dataframe(display_df, use_container_width=True, height=400)
+
+        col1, col2, col3 = st.columns([3, 2, 1])
+        with col1:
+            item_search = st.text_input("🔎 Search restaurant or item", key="comp_search")
+        with col2:
+            item_sort = st.selectbox("Sort by", list(ItemTable.SORTS), key="comp_sort")
+        with col3:
+            page_size = st.selectbox("Rows per page", [25, 50, 100], index=1, key="comp_page_size")
+
+        page = int(st.session_state.get('comp_page', 1))
+        page_df, total_items = menu.item_page(selected_categories, item_search, item_sort, page, page_size)
+        page_count = max(1, -(-total_items // page_size))
+        if page > page_count:
+            # Selection shrank below the current page
+            page = st.session_state.comp_page = 1
+            page_df, total_items = menu.item_page(selected_categories, item_search, item_sort, page, page_size)
+
+        st.dataframe(page_df, column_config=table_formats(euro=['price']), use_container_width=True,
+                     hide_index=True, height=400)
+
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            st.number_input("Page", min_value=1, max_value=page_count, step=1, key="comp_page")
+        with col2:
+            if total_items:
+                first_row = (page - 1) * page_size + 1
+                st.caption(f"Showing {first_row}–{first_row + len(page_df) - 1} of {total_items} items (page {page} of {page_count})")
+            else:
+                st.caption("No items match your search")
 
         # Price positioning
         st.markdown("#### Price Distribution by Restaurant")
-        fig = px.box(filtered_df, x='restaurant', y='price',
-                    labels={'price': 'Price (€)', 'restaurant': ''},
-                    color='restaurant')
-        fig.update_layout(showlegend=False, height=400)
+        # Drawn from precomputed quartiles - raw prices are only sent for the top outliers
+        price_summary, price_outliers = load_price_summary(current_version, tuple(selected_categories))
+        show_outliers = st.checkbox(f"Show the {OUTLIER_LIMIT} most extreme items", key="comp_show_outliers")
+
+        fig = go.Figure(go.Box(
+            x=price_summary.index.astype(str),
+            q1=price_summary['q1'],
+            median=price_summary['median'],
+            q3=price_summary['q3'],
+            lowerfence=price_summary['lowerfence'],
+            upperfence=price_summary['upperfence'],
+            mean=price_summary['mean'],
+            marker_color='#667eea',
+            name=''
+        ))
+        if show_outliers and len(price_outliers):
+            fig.add_trace(go.Scatter(
+                x=price_outliers['restaurant'].astype(str),
+                y=price_outliers['price'],
+                mode='markers',
+                text=price_outliers['item_name'],
+                hovertemplate='%{text}<br>€%{y:.2f}<extra></extra>',
+                marker=dict(color='#E74C3C', size=8),
+                name=''
+            ))
+        fig.update_layout(showlegend=False, height=400, yaxis_title='Price (€)')
         st.plotly_chart(fig, use_container_width=True)
 
     with tab3:
@@ -1002,15 +1238,13 @@ try:
                 )
 
             with col2:
-                st.markdown("#### 🔍 Compare with Category")
-                compare_category = st.selectbox(
-                    "Category",
-                    sorted(df['category'].unique()),
+                st.markdown("#### 🔍 Compare with Competitors")
+                competitor_items, _ = select_competitor_items(
+                    menu, load_similarity_index(current_version), item_name,
                     key="quick_category",
-                    help="Select a category to compare against competitor pricing"
+                    help_text="Select a category to compare against competitor pricing"
                 )
 
-                competitor_items = df[df['category'] == compare_category]
                 if len(competitor_items) > 0:
                     avg_competitor_price = competitor_items['price'].mean()
                     min_competitor_price = competitor_items['price'].min()
@@ -1020,7 +1254,7 @@ try:
                     st.metric("Competitor Range", f"€{min_competitor_price:.2f} - €{max_competitor_price:.2f}")
 
             # Calculate margins
-            if your_price > 0:
+            if your_price > 0 and len(competitor_items) > 0:
                 profit_per_item = your_price - ingredient_cost
                 margin_percentage = (profit_per_item / your_price) * 100
                 food_cost_pct = (ingredient_cost / your_price) * 100
@@ -1109,12 +1343,16 @@ try:
                 })
 
                 scenarios_df = pd.DataFrame(scenarios_data)
-                scenarios_df['Price (€)'] = scenarios_df['Price (€)'].apply(lambda x: f"{x:.2f}")
-                scenarios_df['Profit/Item (€)'] = scenarios_df['Profit/Item (€)'].apply(lambda x: f"{x:.2f}")
-                scenarios_df['Monthly Profit (€)'] = scenarios_df['Monthly Profit (€)'].apply(lambda x: f"{x:.2f}")
-                scenarios_df['Food Cost %'] = scenarios_df['Food Cost %'].apply(lambda x: f"{x:.1f}%")
 
-                st.dataframe(scenarios_df, use_container_width=True, hide_index=True)
+                st.dataframe(
+                    scenarios_df,
+                    column_config=table_formats(
+                        number=['Price (€)', 'Profit/Item (€)', 'Monthly Profit (€)'],
+                        percent=['Food Cost %']
+                    ),
+                    use_container_width=True,
+                    hide_index=True
+                )
 
         # MENU ENGINEERING
         elif calc_mode == "🎯 Menu Engineering":
@@ -1275,12 +1513,16 @@ try:
                 st.markdown("---")
                 display_df = menu_df[['name', 'price', 'profit_per_item', 'monthly_sales', 'total_profit', 'food_cost_pct', 'category']].copy()
                 display_df.columns = ['Item', 'Price (€)', 'Profit/Item (€)', 'Monthly Sales', 'Monthly Profit (€)', 'Food Cost %', 'Classification']
-                display_df['Price (€)'] = display_df['Price (€)'].apply(lambda x: f"€{x:.2f}")
-                display_df['Profit/Item (€)'] = display_df['Profit/Item (€)'].apply(lambda x: f"€{x:.2f}")
-                display_df['Monthly Profit (€)'] = display_df['Monthly Profit (€)'].apply(lambda x: f"€{x:.2f}")
-                display_df['Food Cost %'] = display_df['Food Cost %'].apply(lambda x: f"{x:.1f}%")
 
-                st.dataframe(display_df, use_container_width=True, hide_index=True)
+                st.dataframe(
+                    display_df,
+                    column_config=table_formats(
+                        euro=['Price (€)', 'Profit/Item (€)', 'Monthly Profit (€)'],
+                        percent=['Food Cost %']
+                    ),
+                    use_container_width=True,
+                    hide_index=True
+                )
 
                 # Scatter plot
                 st.markdown("---")
@@ -1470,14 +1712,17 @@ try:
                     })
 
                 scenarios_df = pd.DataFrame(scenarios)
-                scenarios_df['Monthly Sales'] = scenarios_df['Monthly Sales'].apply(lambda x: f"{x:,}")
-                scenarios_df['Revenue (€)'] = scenarios_df['Revenue (€)'].apply(lambda x: f"€{x:,.2f}")
-                scenarios_df['Variable Costs (€)'] = scenarios_df['Variable Costs (€)'].apply(lambda x: f"€{x:,.2f}")
-                scenarios_df['Fixed Costs (€)'] = scenarios_df['Fixed Costs (€)'].apply(lambda x: f"€{x:,.2f}")
-                scenarios_df['Profit (€)'] = scenarios_df['Profit (€)'].apply(lambda x: f"€{x:,.2f}")
-                scenarios_df['Profit Margin %'] = scenarios_df['Profit Margin %'].apply(lambda x: f"{x:.1f}%")
 
-                st.dataframe(scenarios_df, use_container_width=True, hide_index=True)
+                st.dataframe(
+                    scenarios_df,
+                    column_config=table_formats(
+                        euro=['Revenue (€)', 'Variable Costs (€)', 'Fixed Costs (€)', 'Profit (€)'],
+                        percent=['Profit Margin %'],
+                        integer=['Monthly Sales']
+                    ),
+                    use_container_width=True,
+                    hide_index=True
+                )
 
                 # Visualization
                 st.markdown("---")
@@ -1931,14 +2176,12 @@ try:
             with strategy_tab3:
                 st.markdown("#### Compare with Competitor Prices")
 
-                compare_category_target = st.selectbox(
-                    "Category",
-                    sorted(df['category'].unique()),
+                competitor_items_target, _ = select_competitor_items(
+                    menu, load_similarity_index(current_version), target_item_name,
                     key="target_category",
-                    help="Select a category to compare pricing"
+                    help_text="Select a category to compare pricing"
                 )
 
-                competitor_items_target = df[df['category'] == compare_category_target]
                 if len(competitor_items_target) > 0:
                     comp_avg = competitor_items_target['price'].mean()
                     comp_min = competitor_items_target['price'].min()
@@ -2000,13 +2243,13 @@ try:
                         st.warning(f"⚠️ **High cost item.** Your ideal price (€{ideal_price:.2f}) is significantly above market average (€{comp_avg:.2f}). Consider reducing costs or emphasizing premium value.")
 
                 else:
-                    st.info("Select a category to see competitor pricing data.")
+                    st.info("Select a category or item name with competitor pricing data.")
 
     with tab4:
         st.markdown("### 🤖 AI-Powered Pricing Recommendations")
         st.markdown("Get personalized pricing insights powered by Claude AI based on your costs and competitor data.")
 
-        client = get_claude_client()
+        client, _ = get_ai_runner()
 
         if not client:
             st.warning("⚠️ Claude API key not configured. Set ANTHROPIC_API_KEY environment variable to enable AI recommendations.")
@@ -2060,32 +2303,45 @@ try:
 
             with col2:
                 st.markdown("#### 🔍 Market Comparison")
-                ai_compare_category = st.selectbox(
-                    "Category",
-                    sorted(df['category'].unique()),
+                ai_competitor_items, ai_compare_category = select_competitor_items(
+                    menu, load_similarity_index(current_version), ai_item_name,
                     key="ai_category",
-                    help="Category to compare against for AI analysis"
+                    help_text="Category to compare against for AI analysis"
                 )
-                ai_competitor_items = df[df['category'] == ai_compare_category]
 
                 if len(ai_competitor_items) > 0:
                     st.metric("Competitor Items", len(ai_competitor_items))
                     st.metric("Market Average", f"€{ai_competitor_items['price'].mean():.2f}")
 
-            if st.button("🤖 Generate AI Recommendations", type="primary", help="Click to get AI-powered pricing insights"):
-                with st.spinner("🧠 Analyzing your pricing with Claude AI..."):
-                    recommendations = get_ai_recommendations(
-                        ai_item_name,
-                        ai_your_price,
-                        ai_ingredient_cost,
-                        ai_competitor_items,
-                        ai_compare_category
-                    )
+            if st.button("🤖 Generate AI Recommendations", type="primary", help="Click to get AI-powered pricing insights",
+                         disabled=len(ai_competitor_items) == 0):
+                future, cached = get_ai_recommendations(
+                    ai_item_name,
+                    ai_your_price,
+                    ai_ingredient_cost,
+                    ai_competitor_items,
+                    ai_compare_category,
+                    current_version
+                )
+                if future:
+                    st.session_state.ai_request = {
+                        'future': future,
+                        'cached': cached,
+                        'item_name': ai_item_name,
+                        'price': ai_your_price
+                    }
 
-                    if recommendations:
-                        st.markdown("---")
-                        st.markdown("### 💡 AI Analysis & Recommendations")
-                        st.markdown(recommendations)
+            # The latest request survives reruns; while it runs only the polling fragment refreshes
+            ai_request = st.session_state.get('ai_request')
+            if ai_request:
+                if ai_request['future'].done():
+                    st.markdown("---")
+                    st.markdown("### 💡 AI Analysis & Recommendations")
+                    st.caption(f"{ai_request['item_name']} at €{ai_request['price']:.2f}"
+                               + (" - ↺ cached answer for identical inputs" if ai_request['cached'] else ""))
+                    st.markdown(ai_request['future'].result())
+                else:
+                    wait_for_ai_recommendations(ai_request['future'])
 
     with tab5:
         st.markdown("### 🔄 Data Collection")
@@ -2124,6 +2380,24 @@ try:
                     help="How many restaurants to scrape data from"
                 )
 
+            num_workers = st.number_input(
+                "Parallel Browser Workers",
+                min_value=1,
+                max_value=ScraperManager.MAX_PER_HOST,
+                value=1,
+                step=1,
+                key="scraper_workers",
+                help="Number of headless Chrome sessions scraping at the same time. Each uses ~300 MB of memory. "
+                     f"Thuisbezorgd is one host, which allows {ScraperManager.MAX_PER_HOST} concurrent page loads."
+            )
+
+            incremental = st.checkbox(
+                "Only re-scrape changed restaurants",
+                value=False,
+                key="scraper_incremental",
+                help="Skip restaurants whose menu is unchanged since the last run and keep their previous data"
+            )
+
             scraper_type = st.selectbox(
                 "Data Source",
                 ["Thuisbezorgd.nl"],
@@ -2136,19 +2410,16 @@ try:
             st.markdown("#### 📊 Current Data Status")
 
             try:
-                with open('scraped_menus.json', 'r', encoding='utf-8') as f:
-                    current_data = json.load(f)
-                    st.metric("Restaurants", len(current_data))
-                    total_items = sum(len(r.get('menu_items', [])) for r in current_data)
-                    st.metric("Menu Items", total_items)
-
-                    # Get last update time
-                    if current_data:
-                        import datetime
-                        last_update = current_data[0].get('scraped_at', 'Unknown')
-                        st.caption(f"Last updated: {last_update[:16]}")
-
-                    st.success("✅ Data loaded")
+                store_summary = load_store_summary(current_version)
+                st.metric("Restaurants", len(store_summary))
+                st.metric("Menu Items", int(store_summary['Items'].sum()))
+
+                # Get last update time
+                if len(store_summary):
+                    last_update = store_summary['Scraped At'].max() or 'Unknown'
+                    st.caption(f"Last updated: {last_update[:16]}")
+
+                st.success("✅ Data loaded")
             except FileNotFoundError:
                 st.warning("⚠️ No data yet")
                 st.info("Click 'Start Collection' to gather data")
@@ -2177,7 +2448,16 @@ try:
             if st.session_state.scraping_in_progress:
                 st.warning("⏳ Scraping in progress... This may take several minutes.")
 
-        if start_button:
+        # Offer to continue a run that was interrupted (crash, rerun, Ctrl-C)
+        resume_button = False
+        unfinished_job = JobJournal.latest_unfinished()
+        if unfinished_job and not st.session_state.scraping_in_progress:
+            job_city, job_scraped, job_total = load_job_summary(unfinished_job.signature())
+            st.info(f"⏯️ An interrupted collection for {job_city.title()} "
+                    f"has {job_scraped}/{job_total} restaurants scraped.")
+            resume_button = st.button("⏯️ Resume Collection", key="resume_scraper")
+
+        if start_button or resume_button:
             st.session_state.scraping_in_progress = True
             st.session_state.scraping_complete = False
 
@@ -2201,17 +2481,24 @@ try:
                 max_rest = None if scrape_all else num_restaurants
 
                 # Start scraping
-                info_box.info(f"🔍 Discovering restaurants in {city}...")
-                data = manager.discover_and_scrape_thuisbezorgd(
-                    city=city.lower(),
-                    max_restaurants=max_rest,
-                    progress_callback=update_progress
-                )
+                if resume_button:
+                    info_box.info("⏯️ Resuming interrupted collection...")
+                    data = manager.resume(progress_callback=update_progress)
+                else:
+                    info_box.info(f"🔍 Discovering restaurants in {city}...")
+                    data = manager.discover_and_scrape_thuisbezorgd(
+                        city=city.lower(),
+                        max_restaurants=max_rest,
+                        progress_callback=update_progress,
+                        workers=int(num_workers),
+                        incremental=incremental
+                    )
 
                 # Save data
                 status_text.text("💾 Saving data...")
                 manager.save_to_json('scraped_menus.json')
                 manager.save_to_csv('scraped_menus.csv')
+                manager.save_to_parquet('scraped_menus.parquet')
 
                 # Cleanup
                 manager.close_all()
@@ -2336,22 +2623,10 @@ try:
                             if not result:
                                 st.warning(f"⚠️ Could not scrape {cafe['name']} - site structure may not be compatible")
 
-                        # Load existing data and merge
-                        try:
-                            with open('scraped_menus.json', 'r', encoding='utf-8') as f:
-                                existing_data = json.load(f)
-                        except FileNotFoundError:
-                            existing_data = []
-
-                        # Merge with existing data (avoid duplicates by URL)
-                        existing_urls = {r['url'] for r in existing_data}
-                        for restaurant in manager.data:
-                            if restaurant['url'] not in existing_urls:
-                                existing_data.append(restaurant)
-
-                        # Save combined data
-                        with open('scraped_menus.json', 'w', encoding='utf-8') as f:
-                            json.dump(existing_data, f, indent=2, ensure_ascii=False)
+                        # Cafes were appended to the JSONL store as they were scraped -
+                        # compact it into the combined snapshot (newest record per URL wins)
+                        manager.save_to_json('scraped_menus.json')
+                        manager.save_to_parquet('scraped_menus.parquet')
 
                         manager.close_all()
 
@@ -2473,22 +2748,9 @@ try:
         if st.session_state.scraping_complete:
             with st.expander("📋 View Scraped Data Summary"):
                 try:
-                    with open('scraped_menus.json', 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-
-                    st.write(f"**Total Restaurants:** {len(data)}")
-
-                    # Create summary table
-                    summary_data = []
-                    for restaurant in data:
-                        summary_data.append({
-                            'Restaurant': restaurant['restaurant_name'],
-                            'Items': restaurant['total_items'],
-                            'Types': ', '.join(restaurant.get('restaurant_types', [])),
-                            'Price Range': restaurant.get('price_range', 'unknown')
-                        })
+                    df_summary = load_store_summary(data_version()).drop(columns='Scraped At')
 
-                    df_summary = pd.DataFrame(summary_data)
+                    st.write(f"**Total Restaurants:** {len(df_summary)}")
                     st.dataframe(df_summary, use_container_width=True)
 
                 except Exception as e:
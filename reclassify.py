@@ -0,0 +1,194 @@
+"""
+Menu Price Optimizer - Batch Reclassifier
+Re-runs the restaurant classifier over already scraped data - no browser, no network
+
+Use it after changing the keyword lists in scrapers/classifier.py:
+    python reclassify.py                          # scraped_menus.json -> scraped_menus.reclassified.json
+    python reclassify.py snapshot.json -o out.json
+    python reclassify.py --apply                  # update the live store and scraped_menus.json
+
+Restaurant types and price ranges are always recomputed. Item categories taken from
+the source site are kept; every category assigned by keywords is derived again
+(records scraped before items carried a category_source: only 'Other' ones).
+"""
+
+import argparse
+import os
+import sys
+import time
+from itertools import islice
+from multiprocessing import Pool
+
+import pandas as pd
+
+from scrapers.classifier import RestaurantClassifier
+from storage import RestaurantStore, iter_json_array, write_json_array, write_jsonl
+
+
+def reclassify_batch(records):
+    """
+    Classify a batch of restaurant records again - item categories and price ranges for the
+    whole batch in one vectorised pass, restaurant types per record
+    Returns [(new record, whether types changed, whether price range changed, items recategorised)]
+    """
+    # Keyword-assigned categories are blanked so they are derived again; site categories are kept
+    site_items = []
+    for record in records:
+        menu_items = []
+        for item in record.get('menu_items', []):
+            source = RestaurantClassifier.category_source(item)
+            category = item.get('category', '') if source == 'site' else ''
+            menu_items.append(dict(item, category=category, category_source=source))
+        site_items.append(menu_items)
+
+    items = pd.DataFrame(
+        [
+            (position, item.get('name', ''), item.get('price'), item['category'])
+            for position, menu_items in enumerate(site_items)
+            for item in menu_items
+        ],
+        columns=['restaurant', 'name', 'price', 'category']
+    )
+    items['price'] = pd.to_numeric(items['price'], errors='coerce')
+    categories = RestaurantClassifier.categorize_menu_items(items['name'], items['category']).tolist()
+
+    price_info = RestaurantClassifier.classify_price_ranges(items).reindex(range(len(records)))
+    price_info['range'] = price_info['range'].fillna('unknown')
+    price_info = price_info.fillna(0).to_dict('index')
+
+    results = []
+    start = 0
+    for position, (record, menu_items) in enumerate(zip(records, site_items)):
+        old_categories = [item.get('category') for item in record.get('menu_items', [])]
+        new_categories = categories[start:start + len(menu_items)]
+        start += len(menu_items)
+
+        new_record = dict(record)
+        # Types are matched against the items as a fresh scrape would see them
+        new_record['restaurant_types'] = RestaurantClassifier.classify_restaurant_type(
+            record.get('restaurant_name', ''), menu_items
+        )
+        new_record['price_info'] = {key: value if key == 'range' else float(value)
+                                    for key, value in price_info[position].items()}
+        new_record['price_range'] = new_record['price_info']['range']
+        new_record['menu_items'] = [
+            dict(item, category=category) for item, category in zip(menu_items, new_categories)
+        ]
+
+        items_changed = sum(1 for old, new in zip(old_categories, new_categories) if old != new)
+        results.append((
+            new_record,
+            new_record['restaurant_types'] != record.get('restaurant_types'),
+            new_record['price_range'] != record.get('price_range'),
+            items_changed
+        ))
+    return results
+
+
+def read_records(path):
+    """Stream restaurant records from a JSON snapshot or the current records of a JSONL store"""
+    if path.endswith('.jsonl'):
+        return RestaurantStore(path, seed_from=None).latest()
+    return iter_json_array(path)
+
+
+def iter_batches(records, batch_size):
+    records = iter(records)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def reclassify_stream(records, workers=None, batch_size=256):
+    """
+    Reclassify records across worker processes, yielding results in input order
+    Works in batches so memory stays bounded however large the input is
+    """
+    workers = workers or os.cpu_count() or 1
+    batches = iter_batches(records, batch_size)
+
+    if workers == 1:
+        for batch in batches:
+            yield from reclassify_batch(batch)
+        return
+
+    with Pool(workers) as pool:
+        # A few batches per worker at a time - imap alone would read the whole input ahead
+        while True:
+            window = list(islice(batches, workers * 2))
+            if not window:
+                break
+            for results in pool.imap(reclassify_batch, window):
+                yield from results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reclassify scraped restaurants without re-scraping")
+    parser.add_argument('input', nargs='?', default='scraped_menus.json',
+                        help="JSON snapshot or JSONL store to read (default: scraped_menus.json)")
+    parser.add_argument('-o', '--output',
+                        help="File to write (.json or .jsonl, default: <input>.reclassified.<ext>)")
+    parser.add_argument('--apply', action='store_true',
+                        help="Update the live store (scraped_menus.jsonl) and scraped_menus.json in place")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="Worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    if args.apply and args.output:
+        parser.error("--apply writes to the live store; drop --output")
+
+    if args.apply:
+        store = RestaurantStore()
+        source = store.latest()
+        print(f"🔄 Reclassifying {store.path}...")
+    else:
+        if not os.path.exists(args.input):
+            print(f"✗ {args.input} not found")
+            return 1
+        source = read_records(args.input)
+        print(f"🔄 Reclassifying {args.input}...")
+
+    stats = {'restaurants': 0, 'items': 0, 'types': 0, 'price_range': 0, 'categories': 0}
+    changed = []
+    start = time.time()
+
+    def tally(results):
+        for record, types_changed, range_changed, items_changed in results:
+            stats['restaurants'] += 1
+            stats['items'] += len(record['menu_items'])
+            stats['types'] += types_changed
+            stats['price_range'] += range_changed
+            stats['categories'] += items_changed
+            if args.apply and (types_changed or range_changed or items_changed):
+                changed.append(record)
+            yield record
+
+    results = tally(reclassify_stream(source, workers=args.workers))
+
+    if args.apply:
+        # Only changed restaurants are appended (after reading, the store is being streamed)
+        for _ in results:
+            pass
+        store.extend(changed)
+        store.compact()
+        destination = f"{store.path} and scraped_menus.json"
+    else:
+        root, ext = os.path.splitext(args.input)
+        destination = args.output or f"{root}.reclassified{ext}"
+        if destination.endswith('.jsonl'):
+            write_jsonl(results, destination)
+        else:
+            write_json_array(results, destination)
+
+    print(f"\n✓ Reclassified {stats['restaurants']} restaurants ({stats['items']} items) in {time.time() - start:.1f}s")
+    print(f"   Restaurant type changed:  {stats['types']} restaurants")
+    print(f"   Price range changed:      {stats['price_range']} restaurants")
+    print(f"   Item category changed:    {stats['categories']} items")
+    print(f"💾 Saved to {destination}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
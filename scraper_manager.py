@@ -6,22 +6,122 @@ Coordinates multi-site scraping operations
 
 import pandas as pd
 import json
-from scrapers import ThuisbezorgdScraper, SquarespaceScraper, GenericScraper
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+from scrapers import ThuisbezorgdScraper, SquarespaceScraper, GenericScraper, DriverProvider
+from scrapers.driver_provider import BLOCK_PROFILES
+from storage import SnapshotStore, FingerprintStore, JobJournal, RestaurantStore, PriceHistory, write_menu_dataset
+
+
+class HostThrottle:
+    """
+    Limits how hard a worker pool hits a single host
+    Caps concurrent requests per host and spaces request starts by a politeness delay
+    """
+
+    def __init__(self, max_per_host=2, delay=2):
+        self.max_per_host = max(1, max_per_host)
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._next_start = {}
+
+    @contextmanager
+    def slot(self, url):
+        """Hold one of the host's request slots for the duration of the block"""
+        host = urlparse(url).netloc.lower()
+
+        with self._lock:
+            semaphore = self._semaphores.setdefault(host, threading.Semaphore(self.max_per_host))
+
+        semaphore.acquire()
+        try:
+            # Reserve the next start time for this host, then wait for it outside the lock
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start + self.delay
+
+            if start > now:
+                time.sleep(start - now)
+
+            yield
+        finally:
+            semaphore.release()
 
 
 class ScraperManager:
     """Manages multiple scrapers and coordinates scraping operations"""
 
-    def __init__(self, headless=True):
-        """Initialize scraper manager"""
+    # Concurrent page loads allowed per host - Thuisbezorgd is one host, so this also caps its workers
+    MAX_PER_HOST = 2
+
+    def __init__(self, headless=True, snapshot_dir='snapshots', block_profile=None,
+                 fingerprint_file='fingerprints.json', job_dir='jobs', store_file='scraped_menus.jsonl',
+                 history_file='price_history.db'):
+        """
+        Initialize scraper manager
+        snapshot_dir: where raw page HTML is archived for replay (None to disable)
+        block_profile: resource-blocking profile for all scrapers ('lean', 'media' or 'none');
+                       None (default) lets each scraper use its class's BLOCK_PROFILE
+        fingerprint_file: per-URL fingerprints of the last scrape, used by incremental runs
+        job_dir: where scrape job journals are kept for resume()
+        store_file: append-only JSONL log every scraped restaurant is written to (None to disable)
+        history_file: SQLite price history every scraped price is added to (None to disable)
+        """
         self.headless = headless
+        self.block_profile = block_profile
+        self.snapshot_store = SnapshotStore(snapshot_dir) if snapshot_dir else None
+        self.fingerprint_store = FingerprintStore(fingerprint_file)
+        self.job_dir = job_dir
+        self.restaurant_store = RestaurantStore(store_file) if store_file else None
+        self.price_history = PriceHistory(history_file, seed_from=store_file) if history_file else None
+
+        # All scrapers borrow one Chrome session instead of starting one each
+        self.driver_provider = self._new_driver_provider(ThuisbezorgdScraper, SquarespaceScraper, GenericScraper)
         self.scrapers = {
-            'thuisbezorgd': ThuisbezorgdScraper(headless=headless),
-            'squarespace': SquarespaceScraper(headless=headless),
-            'generic': GenericScraper(headless=headless)
+            'thuisbezorgd': ThuisbezorgdScraper(headless=headless, driver_provider=self.driver_provider,
+                                                block_profile=block_profile),
+            'squarespace': SquarespaceScraper(headless=headless, driver_provider=self.driver_provider,
+                                              block_profile=block_profile),
+            'generic': GenericScraper(headless=headless, driver_provider=self.driver_provider,
+                                      block_profile=block_profile)
         }
+        for scraper in self.scrapers.values():
+            scraper.snapshot_store = self.snapshot_store
         self.data = []
 
+    def _collect(self, restaurant_data):
+        """Keep a scraped restaurant and append it to the JSONL store and price history straight away"""
+        self.data.append(restaurant_data)
+        if self.restaurant_store:
+            self.restaurant_store.append(restaurant_data)
+        if self.price_history:
+            self.price_history.record(restaurant_data)
+
+    def _release_shared_driver(self):
+        """Quit the shared Chrome session - scrapers start a new one the next time they need it"""
+        self.driver_provider.close()
+        for scraper in self.scrapers.values():
+            scraper.driver = None
+
+    def _new_driver_provider(self, *scraper_classes):
+        """
+        Chrome session whose launch preferences suit the scrapers sharing it - images are
+        a launch setting, so they are blocked only if every scraper's profile blocks them
+        """
+        profiles = [self.block_profile or scraper_class.BLOCK_PROFILE for scraper_class in scraper_classes]
+        unknown = [profile for profile in profiles if profile not in BLOCK_PROFILES]
+        if unknown:
+            raise ValueError(f"Unknown block profile: {unknown[0]}")
+        return DriverProvider(headless=self.headless,
+                              block_images=all(BLOCK_PROFILES[profile]['images'] for profile in profiles))
+
     def get_scraper_for_url(self, url):
         """
         Determine which scraper to use for a URL
@@ -55,7 +155,7 @@ class ScraperManager:
                 result = scraper.scrape_restaurant(url)
 
             if result:
-                self.data.append(result)
+                self._collect(result)
                 return result
             else:
                 print(f"⚠️  No data extracted from {url}")
@@ -72,8 +172,6 @@ class ScraperManager:
         """
         print(f"\n🚀 Starting multi-site scraping of {len(urls)} URLs")
 
-        import time
-
         for i, url_info in enumerate(urls, 1):
             # Handle both string URLs and dict format
             if isinstance(url_info, dict):
@@ -96,56 +194,125 @@ class ScraperManager:
 
         return self.data
 
-    def discover_and_scrape_thuisbezorgd(self, city='maastricht', max_restaurants=None, progress_callback=None):
+    def discover_and_scrape_thuisbezorgd(self, city='maastricht', max_restaurants=None, progress_callback=None,
+                                         workers=1, max_per_host=MAX_PER_HOST, delay=2, incremental=False,
+                                         data_file='scraped_menus.json'):
         """
         Discover all restaurants in a city on Thuisbezorgd and scrape them
         Set max_restaurants=None to scrape ALL restaurants (default)
         progress_callback: optional function(current, total, message) for UI updates
+        workers: number of parallel headless Chrome sessions (1 = scrape one after another)
+        max_per_host: max concurrent page loads per host when using workers (Thuisbezorgd is a
+                      single host, so more workers than this are not used)
+        delay: politeness delay in seconds between page loads on the same host
+        incremental: only re-extract restaurants whose fingerprint changed, carrying the
+                     rest forward from data_file with their original scraped_at
+        Progress is journaled under job_dir as it goes - an interrupted run continues with resume()
         """
         print(f"\n{'='*60}")
         print(f"🔍 DISCOVERING & SCRAPING THUISBEZORGD - {city.upper()}")
         print(f"{'='*60}")
 
+        journal = JobJournal.create(
+            self.job_dir, city=city, max_restaurants=max_restaurants, workers=workers,
+            max_per_host=max_per_host, delay=delay, incremental=incremental, data_file=data_file
+        )
+        print(f"📝 Job journal: {journal.path}")
+
+        return self._run_thuisbezorgd_job(journal, journal.load(), progress_callback)
+
+    def resume(self, job_path=None, progress_callback=None):
+        """
+        Continue an interrupted Thuisbezorgd job (the latest unfinished one by default)
+        Restaurants the journal already has are restored into self.data, only the rest are scraped
+        """
+        journal = JobJournal(job_path) if job_path else JobJournal.latest_unfinished(self.job_dir)
+        if journal is None:
+            print("✓ No interrupted scrape job to resume")
+            return self.data
+
+        state = journal.load()
+        total = len(state['urls']) if state['urls'] is not None else '?'
+
+        print(f"\n{'='*60}")
+        print(f"⏯️  RESUMING THUISBEZORGD JOB - {state['params']['city'].upper()}")
+        print(f"   {len(state['results'])}/{total} restaurants already scraped ({journal.path})")
+        print(f"{'='*60}")
+
+        self.data.extend(state['results'].values())
+        return self._run_thuisbezorgd_job(journal, state, progress_callback)
+
+    def _run_thuisbezorgd_job(self, journal, state, progress_callback=None):
+        """Discover (unless the journal already has the URL list) and scrape every URL still pending"""
+        params = state['params']
+        city = params['city']
         thuisbezorgd = self.scrapers['thuisbezorgd']
 
-        # Discover restaurants
-        if progress_callback:
-            progress_callback(0, 100, f"Discovering restaurants in {city.title()}...")
+        if state['urls'] is None:
+            # Discover restaurants
+            if progress_callback:
+                progress_callback(0, 100, f"Discovering restaurants in {city.title()}...")
 
-        restaurant_urls = thuisbezorgd.discover_restaurants(city=city, max_restaurants=max_restaurants)
+            restaurant_urls = thuisbezorgd.discover_restaurants(city=city, max_restaurants=params['max_restaurants'])
 
-        if not restaurant_urls:
-            print(f"⚠️  No restaurants found in {city}")
-            return []
+            if not restaurant_urls:
+                print(f"⚠️  No restaurants found in {city}")
+                journal.finish()
+                return []
+
+            journal.record_discovered(restaurant_urls)
+            state['urls'] = restaurant_urls
+
+            print(f"\n📋 Found {len(restaurant_urls)} restaurants to scrape")
+            print(f"{'='*60}\n")
 
-        print(f"\n📋 Found {len(restaurant_urls)} restaurants to scrape")
-        print(f"{'='*60}\n")
+        restaurant_urls = journal.pending_urls(state)
+
+        previous = self._load_previous_records(params['data_file']) if params['incremental'] else {}
+        if params['incremental']:
+            print(f"↺ Incremental mode: {len(previous)} restaurants from the last run can be carried forward")
 
         if progress_callback:
-            progress_callback(10, 100, f"Found {len(restaurant_urls)} restaurants. Starting scraping...")
+            progress_callback(10, 100, f"Found {len(state['urls'])} restaurants, {len(restaurant_urls)} to scrape. Starting scraping...")
 
         # Scrape each restaurant
-        import time
-        for i, url in enumerate(restaurant_urls, 1):
-            print(f"\n[{i}/{len(restaurant_urls)}] Scraping...")
+        workers, delay = params['workers'], params['delay']
+        if workers > 1 and restaurant_urls:
+            # The pool workers bring their own browsers - don't keep the discovery one idling alongside
+            self._release_shared_driver()
+            self._scrape_with_worker_pool(restaurant_urls, workers, params['max_per_host'], delay, progress_callback,
+                                          previous=previous, journal=journal)
+        else:
+            for i, url in enumerate(restaurant_urls, 1):
+                print(f"\n[{i}/{len(restaurant_urls)}] Scraping...")
 
-            if progress_callback:
-                # Progress from 10% to 90% during scraping
-                progress_pct = 10 + int((i / len(restaurant_urls)) * 80)
-                progress_callback(progress_pct, 100, f"Scraping restaurant {i}/{len(restaurant_urls)}...")
+                if progress_callback:
+                    # Progress from 10% to 90% during scraping
+                    progress_pct = 10 + int((i / len(restaurant_urls)) * 80)
+                    progress_callback(progress_pct, 100, f"Scraping restaurant {i}/{len(restaurant_urls)}...")
 
-            result = thuisbezorgd.scrape_restaurant(url)
+                result = self._scrape_with_restart(thuisbezorgd, url, previous, self._release_shared_driver)
+                journal.record_result(url, result)
 
-            if result:
-                self.data.append(result)
+                if result:
+                    self._collect(result)
 
-            # Delay between requests
-            if i < len(restaurant_urls):
-                time.sleep(2)
+                # Delay between requests
+                if i < len(restaurant_urls):
+                    time.sleep(delay)
 
         if progress_callback:
             progress_callback(90, 100, "Saving data...")
 
+        self.fingerprint_store.save()
+
+        # Done once every URL has a result - failed ones stay pending for resume()
+        unscraped = journal.pending_urls()
+        if unscraped:
+            print(f"\n⚠️  {len(unscraped)} restaurants failed - run resume() to retry them")
+        else:
+            journal.finish()
+
         print(f"\n{'='*60}")
         print(f"✅ Discovery complete! Scraped {len(self.data)} restaurants from {city}")
         print(f"{'='*60}")
@@ -155,6 +322,178 @@ class ScraperManager:
 
         return self.data
 
+    def _scrape_with_restart(self, scraper, url, previous, restart_browser):
+        """
+        _scrape_thuisbezorgd_url, restarting Chrome and retrying once if the browser session died
+        (so one crash doesn't fail every URL after it)
+        """
+        for attempt in range(2):
+            try:
+                return self._scrape_thuisbezorgd_url(scraper, url, previous)
+            except WebDriverException as e:
+                print(f"⚠️  Browser session lost on {url} ({type(e).__name__}) - restarting Chrome")
+                restart_browser()
+        return previous.get(url)
+
+    @staticmethod
+    def _session_lost(scraper, error):
+        """True if a scraping error means the Chrome session itself is gone, not just the page"""
+        if isinstance(error, InvalidSessionIdException):
+            return True
+        if not isinstance(error, WebDriverException):
+            return False
+        try:
+            scraper.driver.current_url
+            return False
+        except Exception:
+            return True
+
+    def _scrape_thuisbezorgd_url(self, scraper, url, previous):
+        """
+        Scrape one Thuisbezorgd restaurant, recording its fingerprint for the next run
+        previous: {url: record} from the last run - a restaurant whose HTTP validators or
+        menu DOM hash are unchanged is returned from it instead of being re-extracted
+        """
+        prior = previous.get(url)
+        known = self.fingerprint_store.get(url) if prior else None
+
+        # Cheapest check first: ETag / Last-Modified, no browser involved
+        # (only worth a HEAD request when there is a fingerprint to compare against)
+        validators = scraper.http_validators(url) if known else {}
+        if known and validators and all(known.get(k) == v for k, v in validators.items()):
+            print(f"↺ Unchanged (HTTP validators): {prior['restaurant_name']}")
+            self.fingerprint_store.update(url)
+            return prior
+
+        try:
+            scraper.open_restaurant(url)
+            fingerprint = scraper.menu_fingerprint()
+
+            if (known and fingerprint['dom_hash'] == known.get('dom_hash')
+                    and prior.get('total_items') == known.get('item_count')):
+                print(f"↺ Unchanged menu: {prior['restaurant_name']}")
+                self.fingerprint_store.update(url, **fingerprint, **validators)
+                return prior
+
+            result = scraper.extract_restaurant(url)
+        except Exception as e:
+            if self._session_lost(scraper, e):
+                raise
+            print(f"✗ Error scraping {url}: {e}")
+            if prior:
+                # Keep last run's data rather than dropping the restaurant
+                print(f"  Keeping previous data for {prior['restaurant_name']}")
+            return prior
+
+        self.fingerprint_store.update(url, item_count=result['total_items'], **fingerprint, **validators)
+        return result
+
+    def _load_previous_records(self, data_file):
+        """Restaurants from the last saved run, keyed by URL"""
+        if self.restaurant_store and self.restaurant_store.exists():
+            return {record['url']: record for record in self.restaurant_store.latest() if record.get('url')}
+
+        if not os.path.exists(data_file):
+            return {}
+
+        try:
+            with open(data_file, 'r', encoding='utf-8') as f:
+                return {record['url']: record for record in json.load(f)}
+        except (json.JSONDecodeError, KeyError, TypeError):
+            print(f"⚠️  Could not read {data_file} - scraping everything")
+            return {}
+
+    def _scrape_with_worker_pool(self, urls, workers, max_per_host, delay, progress_callback=None, previous=None,
+                                 journal=None):
+        """
+        Scrape Thuisbezorgd URLs with a pool of workers pulling from a shared queue
+        Each worker owns its own ThuisbezorgdScraper (and so its own Chrome session)
+        Results are collected on the calling thread so progress_callback stays on the UI thread
+        """
+        # Workers beyond max_per_host per host would only start a browser and wait for a slot
+        hosts = len({urlparse(url).netloc.lower() for url in urls})
+        if workers > max_per_host * hosts:
+            print(f"⚠️  {workers} workers requested, but only {max_per_host * hosts} can load pages at once "
+                  f"({hosts} host(s) × max {max_per_host}) - using {max_per_host * hosts}")
+        workers = min(workers, len(urls), max_per_host * hosts)
+        print(f"⚙️  Using {workers} parallel workers (max {max_per_host} per host, {delay}s politeness delay)")
+
+        url_queue = queue.Queue()
+        for url in urls:
+            url_queue.put(url)
+
+        results = queue.Queue()
+        throttle = HostThrottle(max_per_host=max_per_host, delay=delay)
+
+        threads = [
+            threading.Thread(
+                target=self._pool_worker,
+                args=(worker_id, url_queue, results, throttle, previous or {}),
+                name=f"thuisbezorgd-worker-{worker_id}",
+                daemon=True
+            )
+            for worker_id in range(1, workers + 1)
+        ]
+        for thread in threads:
+            thread.start()
+
+        completed = 0
+        while completed < len(urls):
+            try:
+                url, result = results.get(timeout=1)
+            except queue.Empty:
+                # Stop waiting if every worker has died with URLs still queued
+                if not any(thread.is_alive() for thread in threads):
+                    print(f"\n⚠️  All workers stopped - {len(urls) - completed} restaurants not scraped")
+                    break
+                continue
+
+            completed += 1
+            if journal:
+                journal.record_result(url, result)
+            if result:
+                self._collect(result)
+
+            print(f"\n[{completed}/{len(urls)}] Finished {url}")
+
+            if progress_callback:
+                # Progress from 10% to 90% during scraping
+                progress_pct = 10 + int((completed / len(urls)) * 80)
+                progress_callback(progress_pct, 100, f"Scraped {completed}/{len(urls)} restaurants ({workers} workers)...")
+
+        for thread in threads:
+            thread.join(timeout=5)
+
+    def _pool_worker(self, worker_id, url_queue, results, throttle, previous):
+        """Worker loop: one Chrome session, scraping URLs until the queue is empty"""
+        driver_provider = self._new_driver_provider(ThuisbezorgdScraper)
+        scraper = ThuisbezorgdScraper(headless=self.headless, driver_provider=driver_provider,
+                                      block_profile=self.block_profile)
+        scraper.snapshot_store = self.snapshot_store
+
+        def restart_browser():
+            driver_provider.close()
+            scraper.driver = None
+
+        try:
+            while True:
+                try:
+                    url = url_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                result = None
+                try:
+                    with throttle.slot(url):
+                        result = self._scrape_with_restart(scraper, url, previous, restart_browser)
+                except Exception as e:
+                    print(f"✗ Worker {worker_id} error on {url}: {e}")
+
+                results.put((url, result))
+        finally:
+            scraper.close()
+            driver_provider.close()
+
     def scrape_mickey_browns(self):
         """
         Special method to scrape Mickey Browns with all menu pages
@@ -182,36 +521,103 @@ class ScraperManager:
 
         # Combine into single restaurant entry
         if all_items:
-            from scrapers.classifier import RestaurantClassifier
+            # Same scraped_at as replay gives it: the last page's fetch time
+            restaurant_data = self._combine_menu_pages(restaurant_name, 'https://mickeybrowns.nl/', all_items,
+                                                       scraped_at=squarespace.fetched_at)
+            self._collect(restaurant_data)
 
-            restaurant_data = {
-                'restaurant_name': restaurant_name,
-                'url': 'https://mickeybrowns.nl/',
-                'scraped_at': squarespace.get_base_data_structure(restaurant_name, 'https://mickeybrowns.nl/', all_items)['scraped_at'],
-                'menu_items': all_items,
-                'total_items': len(all_items)
-            }
-
-            restaurant_data = RestaurantClassifier.enhance_restaurant_data(restaurant_data)
-            self.data.append(restaurant_data)
-
-            print(f"\n✓ Scraped {len(all_items)} total items from Mickey Browns")
+            print(f"\n✓ Scraped {restaurant_data['total_items']} total items from Mickey Browns")
             print(f"  Types: {', '.join(restaurant_data['restaurant_types'])}")
 
             return restaurant_data
 
         return None
 
+    def _combine_menu_pages(self, restaurant_name, url, all_items, scraped_at=None):
+        """Build one classified restaurant entry from items collected over several menu pages"""
+        from scrapers.classifier import RestaurantClassifier
+
+        squarespace = self.scrapers['squarespace']
+        restaurant_data = squarespace.get_base_data_structure(restaurant_name, url, all_items, scraped_at=scraped_at)
+        return RestaurantClassifier.enhance_restaurant_data(restaurant_data)
+
+    def replay_snapshots(self, until=None):
+        """
+        Re-run extraction over the snapshot archive instead of the network
+        Uses the latest archived fetch of every URL (at or before `until`, an ISO timestamp)
+        Results keep the original fetch time as scraped_at
+        """
+        if self.snapshot_store is None:
+            print("⚠️  No snapshot archive configured")
+            return []
+
+        print(f"\n{'='*60}")
+        print(f"♻️  REPLAYING SNAPSHOTS from {self.snapshot_store.root}")
+        print(f"{'='*60}")
+
+        latest = self.snapshot_store.latest(until=until)
+        menu_pages = {}
+
+        for url, entry in latest.items():
+            html = self.snapshot_store.load(entry['sha256'])
+
+            # Pages of a multi-page menu are combined per restaurant below
+            if entry.get('page_name'):
+                menu_pages.setdefault(entry['restaurant_name'], []).append((url, entry, html))
+                continue
+
+            scraper = self.get_scraper_for_url(url)
+            try:
+                result = scraper.parse_html(
+                    html, url,
+                    restaurant_name=entry.get('restaurant_name'),
+                    scraped_at=entry['fetched_at']
+                )
+            except Exception as e:
+                print(f"✗ Error replaying {url}: {e}")
+                continue
+
+            if result:
+                self._collect(result)
+                print(f"✓ {result['restaurant_name']}: {result['total_items']} items")
+
+        squarespace = self.scrapers['squarespace']
+        for restaurant_name, pages in menu_pages.items():
+            all_items = []
+            for url, entry, html in pages:
+                all_items.extend(squarespace.parse_menu_page_html(html, url, entry['page_name']))
+
+            if all_items:
+                root_url = f"{urlparse(pages[0][0]).scheme}://{urlparse(pages[0][0]).netloc}/"
+                scraped_at = max(entry['fetched_at'] for _, entry, _ in pages)
+                restaurant_data = self._combine_menu_pages(restaurant_name, root_url, all_items, scraped_at)
+                self._collect(restaurant_data)
+                print(f"✓ {restaurant_name}: {restaurant_data['total_items']} items from {len(pages)} menu pages")
+
+        print(f"\n✅ Replayed {len(self.data)} restaurants from {len(latest)} archived pages")
+        return self.data
+
     def save_to_json(self, filename='scraped_menus.json'):
-        """Save all scraped data to JSON"""
+        """
+        Save all scraped data to JSON
+        With a restaurant store this compacts the JSONL log into the snapshot - the latest
+        record for every restaurant ever scraped, not only this run's
+        """
+        if self.restaurant_store:
+            count = self.restaurant_store.compact(snapshot_path=filename)
+            print(f"\n💾 Data saved to {filename} ({count} restaurants)")
+            return
+
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(self.data, f, indent=2, ensure_ascii=False)
         print(f"\n💾 Data saved to {filename}")
 
     def save_to_csv(self, filename='scraped_menus.csv'):
         """Save scraped data to CSV (flattened)"""
+        restaurants = self.restaurant_store.latest() if self.restaurant_store else self.data
+
         rows = []
-        for restaurant in self.data:
+        for restaurant in restaurants:
             restaurant_types = ', '.join(restaurant.get('restaurant_types', []))
             price_range = restaurant.get('price_range', 'unknown')
 
@@ -232,6 +638,12 @@ class ScraperManager:
         df.to_csv(filename, index=False, encoding='utf-8')
         print(f"💾 Data saved to {filename}")
 
+    def save_to_parquet(self, filename='scraped_menus.parquet'):
+        """Save scraped data as a flat, typed columnar dataset (one row per menu item) for the dashboard"""
+        restaurants = self.restaurant_store.latest() if self.restaurant_store else self.data
+        if write_menu_dataset(restaurants, filename):
+            print(f"💾 Data saved to {filename}")
+
     def print_summary(self):
         """Print a summary of scraped data"""
         print(f"\n{'='*60}")
@@ -274,7 +686,10 @@ class ScraperManager:
         print(f"\n{'='*60}")
 
     def close_all(self):
-        """Close all scrapers"""
+        """Close all scrapers and the shared browser session"""
         for scraper in self.scrapers.values():
             scraper.close()
+        self.driver_provider.close()
+        if self.price_history:
+            self.price_history.close()
         print("\n✓ All scrapers closed")
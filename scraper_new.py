@@ -33,8 +33,10 @@ def main():
     print("3. Scrape Mickey Browns (multi-page cafe)")
     print("4. Scrape custom URLs (mixed sources)")
     print("5. Full Maastricht scrape (Thuisbezorgd + cafes)")
+    print("6. Replay archived page snapshots (no network)")
+    print("7. Resume interrupted Thuisbezorgd scrape")
 
-    choice = input("\nEnter choice (1-5): ").strip()
+    choice = input("\nEnter choice (1-7): ").strip()
 
     try:
         if choice == '1':
@@ -42,10 +44,15 @@ def main():
             print("\n🔍 Discovering all restaurants on Thuisbezorgd...")
             max_restaurants = input("Max restaurants to scrape (default 50): ").strip()
             max_restaurants = int(max_restaurants) if max_restaurants else 50
+            workers = input("Parallel browser workers (default 1): ").strip()
+            workers = int(workers) if workers else 1
+            incremental = input("Only re-scrape changed restaurants? (y/n, default n): ").strip().lower() == 'y'
 
             manager.discover_and_scrape_thuisbezorgd(
                 city='maastricht',
-                max_restaurants=max_restaurants
+                max_restaurants=max_restaurants,
+                workers=workers,
+                incremental=incremental
             )
 
         elif choice == '2':
@@ -102,6 +109,14 @@ def main():
                 for cafe in cafes:
                     manager.scrape_url(cafe['url'], cafe['name'])
 
+        elif choice == '6':
+            # Re-run extraction over archived pages
+            manager.replay_snapshots()
+
+        elif choice == '7':
+            # Continue the last job from its journal
+            manager.resume()
+
         else:
             print("Invalid choice")
             return
@@ -113,15 +128,18 @@ def main():
         if manager.data:
             manager.save_to_json()
             manager.save_to_csv()
+            manager.save_to_parquet()
 
             print("\n✅ All done! Data saved to:")
             print("  • scraped_menus.json")
             print("  • scraped_menus.csv")
+            print("  • scraped_menus.parquet")
         else:
             print("\n⚠️  No data collected")
 
     except KeyboardInterrupt:
         print("\n\n⚠️  Scraping interrupted by user")
+        print("   Progress is journaled - run again and choose 7 to resume")
 
     except Exception as e:
         print(f"\n✗ Error during scraping: {e}")
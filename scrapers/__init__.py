@@ -5,14 +5,22 @@ Modular web scraping system for restaurant menus
 
 from .base_scraper import BaseScraper
 from .classifier import RestaurantClassifier
+from .keyword_matcher import KeywordMatcher
+from .dedup import dedupe_menu_items
 from .thuisbezorgd_scraper import ThuisbezorgdScraper
 from .squarespace_scraper import SquarespaceScraper
 from .generic_scraper import GenericScraper
+from .html_parser import HtmlPage
+from .driver_provider import DriverProvider
 
 __all__ = [
     'BaseScraper',
     'RestaurantClassifier',
+    'KeywordMatcher',
+    'dedupe_menu_items',
     'ThuisbezorgdScraper',
     'SquarespaceScraper',
-    'GenericScraper'
+    'GenericScraper',
+    'HtmlPage',
+    'DriverProvider'
 ]
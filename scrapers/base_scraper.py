@@ -3,62 +3,227 @@ Base Scraper Class
 Abstract base for all scrapers in the system
 """
 
+import hashlib
+import requests
 from abc import ABC, abstractmethod
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from datetime import datetime
-import time
+from urllib.parse import urlparse
+from .html_parser import HtmlPage
+from .dedup import dedupe_menu_items
+from .driver_provider import DriverProvider, build_chrome_options, BLOCK_PROFILES, USER_AGENT
 
 
 class BaseScraper(ABC):
     """Abstract base class for all scrapers"""
 
-    def __init__(self, headless=True):
-        """Initialize scraper with common settings"""
-        self.options = Options()
-        if headless:
-            self.options.add_argument('--headless')
-        self.options.add_argument('--no-sandbox')
-        self.options.add_argument('--disable-dev-shm-usage')
-        self.options.add_argument('--disable-blink-features=AutomationControlled')
-        self.options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+    # Wait timeouts in seconds - override per site in subclasses
+    PAGE_LOAD_TIMEOUT = 15   # document.readyState == 'complete'
+    CONTENT_TIMEOUT = 10     # CONTENT_SELECTOR present in the DOM
+    COOKIE_TIMEOUT = 2       # consent banner to show up
 
+    # CSS selector that signals the menu has rendered (None = document ready is enough)
+    CONTENT_SELECTOR = None
+    # Without a selector: regex (JavaScript syntax) the page text must match once the menu has rendered
+    CONTENT_TEXT_PATTERN = None
+    # Price-looking text - "€ 4,50", "12.00"
+    PRICE_TEXT_PATTERN = r'€\s*\d|\d[.,]\d{2}\b'
+
+    CONSENT_WORDS = ['accept', 'agree', 'akkoord', 'toestaan', 'accepteren', 'ok']
+
+    # 'dom' queries live elements through WebDriver,
+    # 'html' grabs page_source once and parses it offline with lxml
+    EXTRACTION_MODE = 'dom'
+
+    # Resource-blocking profile from BLOCK_PROFILES: 'lean' skips images, fonts and trackers,
+    # 'media' keeps trackers, 'none' loads everything
+    BLOCK_PROFILE = 'lean'
+
+    def __init__(self, headless=True, extraction_mode=None, driver_provider=None, block_profile=None):
+        """
+        Initialize scraper with common settings
+        driver_provider: shared DriverProvider to borrow Chrome from (default: a private one)
+        block_profile: override BLOCK_PROFILE - image preferences of a shared driver are set by its provider
+        """
+        self.block_profile = block_profile or self.BLOCK_PROFILE
+        if self.block_profile not in BLOCK_PROFILES:
+            raise ValueError(f"Unknown block profile: {self.block_profile}")
+
+        if driver_provider is None:
+            self.options = build_chrome_options(headless, block_images=BLOCK_PROFILES[self.block_profile]['images'])
+            driver_provider = DriverProvider(options=self.options)
+            self._owns_provider = True
+        else:
+            self.options = driver_provider.options
+            self._owns_provider = False
+        self.driver_provider = driver_provider
+
+        self.extraction_mode = extraction_mode or self.EXTRACTION_MODE
+        self.snapshot_store = None  # optional storage.SnapshotStore - archives every fetched page
+        self.fetched_at = None  # when extraction_source last read a page (its snapshot's fetched_at)
         self.driver = None
         self.data = []
+        self._consented_hosts = set()  # hosts whose cookie banner was already accepted in this session
 
     def start_driver(self):
-        """Start the Chrome WebDriver"""
+        """Start the Chrome WebDriver (or borrow the shared one)"""
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=self.options)
-            print("✓ WebDriver started successfully")
+            self.driver = self.driver_provider.get_driver()
+            self._consented_hosts = set()
         except Exception as e:
             print(f"✗ Error starting WebDriver: {e}")
             raise
 
     def close(self):
-        """Close the WebDriver"""
-        if self.driver:
-            self.driver.quit()
-            print("\n✓ WebDriver closed")
+        """Close the WebDriver - a shared driver is left for its provider to close"""
+        if self._owns_provider:
+            self.driver_provider.close()
+        self.driver = None
+
+    def navigate(self, url):
+        """driver.get with this scraper's resource-blocking profile applied"""
+        self.driver_provider.set_blocked_urls(BLOCK_PROFILES[self.block_profile]['patterns'])
+        self.driver.get(url)
+
+    def load_page(self, url):
+        """
+        Navigate to a URL and wait until it is usable:
+        document ready, cookie banner dismissed, menu content rendered
+        """
+        self.navigate(url)
+        self.wait_for_document_ready()
+        self.handle_cookie_popup()
+        return self.wait_for_content()
+
+    def wait_for_document_ready(self, timeout=None):
+        """Wait for document.readyState to be 'complete'"""
+        try:
+            WebDriverWait(self.driver, timeout or self.PAGE_LOAD_TIMEOUT).until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            )
+            return True
+        except TimeoutException:
+            print("⚠️  Timed out waiting for page to load")
+            return False
+
+    def wait_for_element(self, selector, timeout=None):
+        """Wait for an element matching a CSS selector, returns it or None on timeout"""
+        try:
+            return WebDriverWait(self.driver, timeout or self.CONTENT_TIMEOUT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+        except TimeoutException:
+            return None
+
+    def wait_for_text(self, pattern, timeout=None):
+        """Wait for the page text to match a regex, returns False on timeout"""
+        try:
+            WebDriverWait(self.driver, timeout or self.CONTENT_TIMEOUT).until(
+                lambda driver: driver.execute_script(
+                    "return new RegExp(arguments[0], 'i').test(document.body ? document.body.innerText : '');",
+                    pattern
+                )
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def wait_for_content(self, timeout=None):
+        """Wait for the site's CONTENT_SELECTOR (or CONTENT_TEXT_PATTERN), if it has one"""
+        if self.CONTENT_SELECTOR:
+            return self.wait_for_element(self.CONTENT_SELECTOR, timeout) is not None
+        if self.CONTENT_TEXT_PATTERN:
+            return self.wait_for_text(self.CONTENT_TEXT_PATTERN, timeout)
+        return True
+
+    def _find_consent_button(self, driver):
+        """WebDriverWait condition: a visible cookie consent button, or False"""
+        for button in driver.find_elements(By.CSS_SELECTOR, "button")[:10]:
+            text = button.text.lower()
+            if any(word in text for word in self.CONSENT_WORDS) and button.is_displayed():
+                return button
+        return False
 
     def handle_cookie_popup(self):
         """Try to close cookie consent popup"""
         try:
-            time.sleep(2)
-            buttons = self.driver.find_elements("css selector", "button")
-            for button in buttons[:10]:
-                text = button.text.lower()
-                if any(word in text for word in ['accept', 'agree', 'akkoord', 'toestaan', 'accepteren', 'ok']):
-                    button.click()
-                    time.sleep(1)
-                    print("✓ Closed cookie popup")
-                    break
+            # Consent is stored in a cookie, so the banner only shows once per host per session
+            host = urlparse(self.driver.current_url).netloc
+            if host in self._consented_hosts:
+                return
+
+            button = WebDriverWait(
+                self.driver, self.COOKIE_TIMEOUT, poll_frequency=0.25,
+                ignored_exceptions=(StaleElementReferenceException,)
+            ).until(self._find_consent_button)
+            button.click()
+            self._consented_hosts.add(host)
+            print("✓ Closed cookie popup")
+
+            # Wait for the banner to go away instead of sleeping
+            try:
+                WebDriverWait(self.driver, 2).until(EC.invisibility_of_element(button))
+            except TimeoutException:
+                pass
         except:
             pass
 
+    def menu_fingerprint(self):
+        """
+        Cheap change check for the loaded page: hash of the rendered menu text
+        (CONTENT_SELECTOR, or the whole body) plus how many prices it shows
+        """
+        text = self.driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0]))"
+            ".map(el => el.innerText).join('\\n');",
+            self.CONTENT_SELECTOR or 'body'
+        ) or ''
+        return {
+            'dom_hash': hashlib.sha256(text.encode('utf-8')).hexdigest(),
+            'price_count': text.count('€')
+        }
+
+    def http_validators(self, url):
+        """ETag / Last-Modified from a HEAD request - empty if the server sends neither"""
+        try:
+            response = requests.head(url, headers={'User-Agent': USER_AGENT}, timeout=5, allow_redirects=True)
+        except requests.RequestException:
+            return {}
+
+        validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+        return {k: v for k, v in validators.items() if v}
+
+    def extraction_source(self, url=None, **snapshot_metadata):
+        """
+        Document the extraction methods should read from:
+        the live driver, or a parsed copy of its HTML in 'html' mode
+        Also archives the page HTML when a snapshot store is attached; the fetch time is kept in
+        self.fetched_at so the record's scraped_at matches its snapshot (replay then repeats it exactly)
+        """
+        self.fetched_at = datetime.now().isoformat()
+        html = None
+        if self.snapshot_store is not None or self.extraction_mode == 'html':
+            html = self.driver.page_source
+
+        if self.snapshot_store is not None:
+            try:
+                self.snapshot_store.save(
+                    url or self.driver.current_url, html, fetched_at=self.fetched_at,
+                    scraper=type(self).__name__, **snapshot_metadata
+                )
+            except Exception as e:
+                print(f"⚠️  Could not archive page snapshot: {e}")
+
+        if self.extraction_mode == 'html':
+            return HtmlPage(html, url=url or self.driver.current_url)
+        return self.driver
+
     def clean_price(self, price_str):
         """Clean price string to float"""
         try:
@@ -78,12 +243,25 @@ class BaseScraper(ABC):
         """Check if this scraper can handle the given URL"""
         pass
 
-    def get_base_data_structure(self, restaurant_name, url, menu_items):
-        """Standard data structure for all scrapers"""
+    @abstractmethod
+    def parse_html(self, html, url, restaurant_name=None, scraped_at=None):
+        """
+        Extract a restaurant from raw page HTML without a browser - must be implemented by subclass
+        Returns the same structure as scrape_restaurant (or None if nothing was found)
+        """
+        pass
+
+    def get_base_data_structure(self, restaurant_name, url, menu_items, scraped_at=None):
+        """Standard data structure for all scrapers (duplicate items removed)"""
+        unique_items = dedupe_menu_items(menu_items)
+        if len(unique_items) < len(menu_items):
+            print(f"  ↺ Removed {len(menu_items) - len(unique_items)} duplicate items")
+        menu_items = unique_items
+
         return {
             'restaurant_name': restaurant_name,
             'url': url,
-            'scraped_at': datetime.now().isoformat(),
+            'scraped_at': scraped_at or datetime.now().isoformat(),
             'menu_items': menu_items,
             'total_items': len(menu_items)
         }
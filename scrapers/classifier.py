@@ -4,8 +4,20 @@ Classifies restaurants by type, price range, and categorizes menu items
 """
 
 import re
+from bisect import bisect_right
 from typing import List, Dict
 
+import numpy as np
+import pandas as pd
+
+from .keyword_matcher import KeywordMatcher
+
+try:
+    import pyarrow  # noqa: F401 - Arrow-backed strings make vectorised matching several times faster
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    STRING_DTYPE = object
+
 
 class RestaurantClassifier:
     """Classifies restaurants and menu items"""
@@ -46,6 +58,23 @@ class RestaurantClassifier:
         'soups': ['soup', 'soep']
     }
 
+    # Average-price bucket boundaries (adjusted for European restaurant prices)
+    PRICE_RANGE_BOUNDS = [8, 15, 25]
+    PRICE_RANGES = ['budget', 'moderate', 'premium', 'luxury']
+
+    # Compiled keyword matchers (type keywords, category keywords), built on first use
+    _matchers = None
+
+    @classmethod
+    def keyword_matchers(cls):
+        """One multi-keyword matcher per taxonomy, so each text is scanned once"""
+        if cls._matchers is None:
+            cls._matchers = (
+                KeywordMatcher(k for keywords in cls.RESTAURANT_TYPES.values() for k in keywords),
+                KeywordMatcher(k for keywords in cls.ITEM_CATEGORIES.values() for k in keywords)
+            )
+        return cls._matchers
+
     @staticmethod
     def classify_restaurant_type(restaurant_name: str, menu_items: List[Dict]) -> List[str]:
         """
@@ -53,23 +82,23 @@ class RestaurantClassifier:
         Returns list of types (can be multiple)
         """
         types = []
-        restaurant_name_lower = restaurant_name.lower()
+        type_matcher, _ = RestaurantClassifier.keyword_matchers()
 
         # Check restaurant name
+        name_hits = type_matcher.found(restaurant_name.lower())
         for resto_type, keywords in RestaurantClassifier.RESTAURANT_TYPES.items():
-            for keyword in keywords:
-                if keyword in restaurant_name_lower:
-                    if resto_type not in types:
-                        types.append(resto_type)
+            if any(keyword in name_hits for keyword in keywords):
+                types.append(resto_type)
 
         # Check menu items
         menu_text = ' '.join([
             f"{item.get('name', '')} {item.get('description', '')} {item.get('category', '')}"
             for item in menu_items
         ]).lower()
+        menu_hits = type_matcher.found(menu_text)
 
         for resto_type, keywords in RestaurantClassifier.RESTAURANT_TYPES.items():
-            keyword_count = sum(1 for keyword in keywords if keyword in menu_text)
+            keyword_count = sum(1 for keyword in keywords if keyword in menu_hits)
             # If type appears frequently in menu, add it
             if keyword_count >= 3 and resto_type not in types:
                 types.append(resto_type)
@@ -106,14 +135,9 @@ class RestaurantClassifier:
         max_price = max(prices)
 
         # Price range classification (adjusted for European restaurant prices)
-        if avg_price < 8:
-            price_range = 'budget'
-        elif avg_price < 15:
-            price_range = 'moderate'
-        elif avg_price < 25:
-            price_range = 'premium'
-        else:
-            price_range = 'luxury'
+        price_range = RestaurantClassifier.PRICE_RANGES[
+            bisect_right(RestaurantClassifier.PRICE_RANGE_BOUNDS, avg_price)
+        ]
 
         return {
             'range': price_range,
@@ -122,6 +146,18 @@ class RestaurantClassifier:
             'max_price': round(max_price, 2)
         }
 
+    @staticmethod
+    def category_source(item: Dict) -> str:
+        """
+        Where an item's category came from: 'site' (the source menu's own section) or 'keywords'
+        (assigned by categorize_menu_item, so it follows ITEM_CATEGORIES when they change)
+        Records from before the flag existed: only 'Other' is known to be keyword-assigned
+        """
+        if item.get('category_source'):
+            return item['category_source']
+        category = (item.get('category') or '').strip()
+        return 'site' if category and category != 'Other' else 'keywords'
+
     @staticmethod
     def categorize_menu_item(item_name: str, existing_category: str = None) -> str:
         """
@@ -132,16 +168,68 @@ class RestaurantClassifier:
         if existing_category and existing_category.strip():
             return existing_category
 
-        item_name_lower = item_name.lower()
+        _, category_matcher = RestaurantClassifier.keyword_matchers()
+        name_hits = category_matcher.found(item_name.lower())
 
-        # Check against category keywords
-        for category, keywords in RestaurantClassifier.ITEM_CATEGORIES.items():
-            for keyword in keywords:
-                if keyword in item_name_lower:
+        # First category (in taxonomy order) with a keyword in the name
+        if name_hits:
+            for category, keywords in RestaurantClassifier.ITEM_CATEGORIES.items():
+                if any(keyword in name_hits for keyword in keywords):
                     return category.title()
 
         return 'Other'
 
+    @staticmethod
+    def classify_price_ranges(items: pd.DataFrame, by: str = 'restaurant') -> pd.DataFrame:
+        """
+        classify_price_range for every restaurant at once, from an item-level frame
+        with a 'price' column - one groupby, no Python loop
+        Returns one row per restaurant: range, avg_price, min_price, max_price
+        """
+        valid = items[items['price'] > 0]
+        stats = valid.groupby(by, observed=True, sort=False)['price'].agg(['mean', 'min', 'max'])
+        stats = stats.reindex(items[by].unique())
+
+        bins = [-np.inf] + RestaurantClassifier.PRICE_RANGE_BOUNDS + [np.inf]
+        price_range = pd.cut(stats['mean'], bins=bins, labels=RestaurantClassifier.PRICE_RANGES, right=False)
+
+        # Python's round per restaurant, like classify_price_range (Series.round can differ at .xx5)
+        def to_cents(values):
+            return values.map(lambda value: round(value, 2), na_action='ignore').fillna(0)
+
+        return pd.DataFrame({
+            'range': price_range.astype(object).fillna('unknown'),
+            'avg_price': to_cents(stats['mean']),
+            'min_price': to_cents(stats['min']),
+            'max_price': to_cents(stats['max'])
+        }, index=stats.index)
+
+    @staticmethod
+    def categorize_menu_items(item_names: pd.Series, existing_categories: pd.Series = None) -> pd.Series:
+        """
+        categorize_menu_item for a whole column of item names with vectorised string matching
+        One regex pass per category; the first matching category in taxonomy order wins
+        """
+        categories = np.full(len(item_names), 'Other', dtype=object)
+        match = np.ones(len(item_names), dtype=bool)
+
+        # Existing categories that are set are kept; only the rest are matched
+        if existing_categories is not None:
+            existing = existing_categories.fillna('').astype(str)
+            keep = (existing.str.strip() != '').to_numpy()
+            categories[keep] = existing.to_numpy(dtype=object)[keep]
+            match = ~keep
+
+        names = item_names[match].fillna('').astype(str).astype(STRING_DTYPE).str.lower()
+        conditions = [
+            names.str.contains('|'.join(re.escape(keyword) for keyword in keywords), regex=True).to_numpy(dtype=bool)
+            for keywords in RestaurantClassifier.ITEM_CATEGORIES.values()
+        ]
+        choices = [category.title() for category in RestaurantClassifier.ITEM_CATEGORIES]
+        categories[match] = np.select(conditions, choices, default='Other')
+
+        return pd.Series(categories, index=item_names.index)
+
     @staticmethod
     def enhance_restaurant_data(restaurant_data: Dict) -> Dict:
         """
@@ -158,14 +246,16 @@ class RestaurantClassifier:
         # Classify price range
         price_info = RestaurantClassifier.classify_price_range(menu_items)
 
-        # Enhance menu items with better categories
+        # Enhance menu items with better categories - site categories are kept, keyword ones re-derived
         enhanced_items = []
         for item in menu_items:
             item_copy = item.copy()
+            source = RestaurantClassifier.category_source(item)
             item_copy['category'] = RestaurantClassifier.categorize_menu_item(
                 item.get('name', ''),
-                item.get('category', '')
+                item.get('category', '') if source == 'site' else ''
             )
+            item_copy['category_source'] = source
             enhanced_items.append(item_copy)
 
         # Add classification data
@@ -0,0 +1,83 @@
+"""
+Menu Item Deduplication
+Drops items the parsers emitted more than once (repeated lines, nested selectors,
+the same item on several menu pages) before they inflate counts and skew averages
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List
+
+
+# Names at the same price at least this similar are treated as one item
+FUZZY_THRESHOLD = 0.9
+# Characters of the normalised name used as a blocking key
+PREFIX_LENGTH = 4
+
+
+def normalize_item_name(name: str) -> str:
+    """Lowercase, accents and punctuation stripped, whitespace collapsed"""
+    name = unicodedata.normalize('NFKD', name or '')
+    name = ''.join(char for char in name if not unicodedata.combining(char))
+    return re.sub(r'[\W_]+', ' ', name.lower()).strip()
+
+
+def dedupe_menu_items(items: List[Dict], threshold: float = FUZZY_THRESHOLD) -> List[Dict]:
+    """
+    Remove duplicate menu items: the same normalised name (or the same words in another
+    order) at the same price, or near-identical names at the same price
+    Candidates are only compared inside blocks sharing a price and a name prefix or word set,
+    never all pairs. The first occurrence is kept, in order, taking a description from its
+    duplicates if it has none
+    """
+    names = [normalize_item_name(item.get('name', '')) for item in items]
+    parent = list(range(len(items)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i, j):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            # The earlier item stays the representative
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    prefix_blocks = defaultdict(list)
+    word_blocks = defaultdict(list)
+    for i, item in enumerate(items):
+        price = item.get('price')
+        price = round(price, 2) if isinstance(price, (int, float)) else price
+        prefix_blocks[(price, names[i][:PREFIX_LENGTH])].append(i)
+        word_blocks[(price, ' '.join(sorted(set(names[i].split()))))].append(i)
+
+    # Same words at the same price: duplicates outright
+    for members in word_blocks.values():
+        for i in members[1:]:
+            union(members[0], i)
+
+    # Same prefix at the same price: compare names ("Menu 1" and "Menu 2" stay apart)
+    numbers = [re.findall(r'\d+', name) for name in names]
+    for members in prefix_blocks.values():
+        for position, i in enumerate(members):
+            for j in members[:position]:
+                if find(i) == find(j) or numbers[i] != numbers[j]:
+                    continue
+                matcher = SequenceMatcher(None, names[i], names[j])
+                if matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold:
+                    union(i, j)
+                    break
+
+    unique = {}
+    for i, item in enumerate(items):
+        root = find(i)
+        if root not in unique:
+            unique[root] = item
+        elif not unique[root].get('description') and item.get('description'):
+            unique[root] = {**unique[root], 'description': item['description']}
+
+    return list(unique.values())
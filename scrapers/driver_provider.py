@@ -0,0 +1,114 @@
+"""
+Driver Provider
+Shares one Chrome session between scrapers
+Resolves the chromedriver binary once per process
+"""
+
+import threading
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+
+# URL patterns for CDP Network.setBlockedURLs ('*' is a wildcard over the full URL)
+IMAGE_PATTERNS = [
+    '*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.avif*', '*.ico*',
+    '*.mp4*', '*.webm*', '*images.squarespace-cdn.com*'
+]
+FONT_PATTERNS = [
+    '*.woff*', '*.ttf*', '*.otf*', '*.eot*',
+    '*fonts.googleapis.com*', '*fonts.gstatic.com*', '*use.typekit.net*'
+]
+TRACKER_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*connect.facebook.net*', '*hotjar.com*', '*clarity.ms*',
+    '*segment.io*', '*cdn.segment.com*', '*optimizely.com*', '*nr-data.net*',
+    '*bat.bing.com*', '*analytics.tiktok.com*', '*criteo.com*'
+]
+
+# Resource-blocking profiles
+# 'images' also switches off image loading in Chrome preferences when the browser starts
+BLOCK_PROFILES = {
+    'none': {'images': False, 'patterns': []},
+    'media': {'images': True, 'patterns': IMAGE_PATTERNS + FONT_PATTERNS},
+    'lean': {'images': True, 'patterns': IMAGE_PATTERNS + FONT_PATTERNS + TRACKER_PATTERNS}
+}
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def get_driver_path():
+    """Resolve (and download if needed) the chromedriver binary - only the first call does any work"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+    return _driver_path
+
+
+def build_chrome_options(headless=True, block_images=False):
+    """Common Chrome settings for all scrapers"""
+    options = Options()
+    if headless:
+        options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument(f'user-agent={USER_AGENT}')
+    if block_images:
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    return options
+
+
+class DriverProvider:
+    """
+    Lazily starts one Chrome session that several scrapers borrow
+    Give each worker thread its own provider - a WebDriver is not thread-safe
+    """
+
+    def __init__(self, headless=True, options=None, block_images=False):
+        self.options = options or build_chrome_options(headless, block_images=block_images)
+        self.driver = None
+        self._blocked_urls = None
+
+    def get_driver(self):
+        """Return the shared driver, starting Chrome on first use"""
+        if self.driver is None:
+            service = Service(get_driver_path())
+            self.driver = webdriver.Chrome(service=service, options=self.options)
+            print("✓ WebDriver started successfully")
+        return self.driver
+
+    def set_blocked_urls(self, patterns):
+        """
+        Block requests matching URL patterns through CDP Network.setBlockedURLs
+        Scrapers sharing the driver may use different profiles, so this is called before
+        every navigation - it only talks to Chrome when the pattern list changes
+        """
+        patterns = list(patterns)
+        if self.driver is None or patterns == self._blocked_urls:
+            return
+
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        except Exception as e:
+            print(f"⚠️  Could not apply resource blocking: {e}")
+        self._blocked_urls = patterns
+
+    def close(self):
+        """Quit the shared Chrome session"""
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                # Chrome already crashed - nothing left to quit
+                print(f"⚠️  WebDriver did not quit cleanly: {e}")
+            self.driver = None
+            self._blocked_urls = None
+            print("\n✓ WebDriver closed")
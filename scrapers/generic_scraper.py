@@ -5,15 +5,19 @@ Uses common patterns and heuristics
 """
 
 from selenium.webdriver.common.by import By
-import time
 import re
 from .base_scraper import BaseScraper
+from .html_parser import HtmlPage
 from .classifier import RestaurantClassifier
 
 
 class GenericScraper(BaseScraper):
     """Generic scraper that tries common menu patterns"""
 
+    # Unknown markup: JS-rendered menus are ready once prices show up (or after a short fallback)
+    CONTENT_TEXT_PATTERN = BaseScraper.PRICE_TEXT_PATTERN
+    CONTENT_TIMEOUT = 6
+
     def can_scrape(self, url):
         """Can attempt any URL"""
         return True
@@ -26,36 +30,19 @@ class GenericScraper(BaseScraper):
         print(f"\n📍 Attempting generic scrape: {url}")
 
         try:
-            self.driver.get(url)
-            time.sleep(4)
-
-            self.handle_cookie_popup()
-            time.sleep(2)
+            self.load_page(url)
+            page = self.extraction_source(url, restaurant_name=restaurant_name)
 
             if not restaurant_name:
-                restaurant_name = self._get_restaurant_name()
-
-            # Try multiple extraction methods
-            menu_items = []
-
-            # Method 1: Structured menu items
-            structured_items = self._extract_structured_items()
-            if structured_items:
-                menu_items.extend(structured_items)
-                print(f"  Found {len(structured_items)} items using structured method")
+                restaurant_name = self._get_restaurant_name(page)
 
-            # Method 2: Text-based extraction
-            if len(menu_items) < 5:  # Only try if structured method didn't find much
-                text_items = self._extract_text_based_items()
-                if text_items:
-                    menu_items.extend(text_items)
-                    print(f"  Found {len(text_items)} items using text-based method")
+            menu_items = self._extract_menu_items(page)
 
             if not menu_items:
                 print("⚠️  No menu items found with generic scraper")
                 return None
 
-            restaurant_data = self.get_base_data_structure(restaurant_name, url, menu_items)
+            restaurant_data = self.get_base_data_structure(restaurant_name, url, menu_items, scraped_at=self.fetched_at)
             restaurant_data = RestaurantClassifier.enhance_restaurant_data(restaurant_data)
 
             self.data.append(restaurant_data)
@@ -67,19 +54,53 @@ class GenericScraper(BaseScraper):
             print(f"✗ Error with generic scraper on {url}: {e}")
             return None
 
-    def _get_restaurant_name(self):
+    def parse_html(self, html, url, restaurant_name=None, scraped_at=None):
+        """Extract a restaurant from saved page HTML (no browser needed)"""
+        page = HtmlPage(html, url=url)
+
+        restaurant_name = restaurant_name or self._get_restaurant_name(page)
+        menu_items = self._extract_menu_items(page)
+
+        if not menu_items:
+            return None
+
+        restaurant_data = self.get_base_data_structure(restaurant_name, url, menu_items, scraped_at=scraped_at)
+        return RestaurantClassifier.enhance_restaurant_data(restaurant_data)
+
+    def _extract_menu_items(self, page=None):
+        """Try the extraction methods in order of reliability"""
+        menu_items = []
+
+        # Method 1: Structured menu items
+        structured_items = self._extract_structured_items(page)
+        if structured_items:
+            menu_items.extend(structured_items)
+            print(f"  Found {len(structured_items)} items using structured method")
+
+        # Method 2: Text-based extraction
+        if len(menu_items) < 5:  # Only try if structured method didn't find much
+            text_items = self._extract_text_based_items(page)
+            if text_items:
+                menu_items.extend(text_items)
+                print(f"  Found {len(text_items)} items using text-based method")
+
+        return menu_items
+
+    def _get_restaurant_name(self, page=None):
         """Extract restaurant name"""
+        page = page or self.driver
+
         try:
             # Try multiple methods
             # 1. Page title
-            title = self.driver.title
+            title = page.title
             if title:
                 clean_title = title.split('|')[0].split('-')[0].strip()
                 if clean_title and len(clean_title) < 50:
                     return clean_title
 
             # 2. H1 tag
-            h1_elements = self.driver.find_elements(By.TAG_NAME, "h1")
+            h1_elements = page.find_elements(By.TAG_NAME, "h1")
             if h1_elements:
                 h1_text = h1_elements[0].text.strip()
                 if h1_text and len(h1_text) < 50:
@@ -87,7 +108,7 @@ class GenericScraper(BaseScraper):
 
             # 3. Site name from meta tags
             try:
-                meta = self.driver.find_element(By.CSS_SELECTOR, "meta[property='og:site_name']")
+                meta = page.find_element(By.CSS_SELECTOR, "meta[property='og:site_name']")
                 site_name = meta.get_attribute("content")
                 if site_name:
                     return site_name
@@ -99,11 +120,12 @@ class GenericScraper(BaseScraper):
         except:
             return "Restaurant"
 
-    def _extract_structured_items(self):
+    def _extract_structured_items(self, page=None):
         """
         Try to extract items from structured HTML
         Looks for common menu item patterns
         """
+        page = page or self.driver
         menu_items = []
 
         # Common selectors for menu items
@@ -119,7 +141,7 @@ class GenericScraper(BaseScraper):
 
         for selector in item_selectors:
             try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                elements = page.find_elements(By.CSS_SELECTOR, selector)
 
                 if len(elements) > 3:  # Only consider if we find multiple items
                     print(f"  Trying selector: {selector} ({len(elements)} elements)")
@@ -185,11 +207,12 @@ class GenericScraper(BaseScraper):
 
         return menu_items
 
-    def _extract_text_based_items(self):
+    def _extract_text_based_items(self, page=None):
         """
         Extract items from plain text when structure is minimal
         Similar to Squarespace scraper
         """
+        page = page or self.driver
         menu_items = []
 
         try:
@@ -199,13 +222,13 @@ class GenericScraper(BaseScraper):
             main_content = None
             for selector in content_selectors:
                 try:
-                    main_content = self.driver.find_element(By.CSS_SELECTOR, selector)
+                    main_content = page.find_element(By.CSS_SELECTOR, selector)
                     break
                 except:
                     continue
 
             if not main_content:
-                main_content = self.driver.find_element(By.TAG_NAME, "body")
+                main_content = page.find_element(By.TAG_NAME, "body")
 
             # Get text and split into lines
             page_text = main_content.text
@@ -0,0 +1,123 @@
+"""
+HTML Parser
+Offline, browser-free view of a page for the extraction code
+Wraps lxml in the small subset of the WebDriver/WebElement API the scrapers use,
+so the same extraction methods run against a live driver or raw page HTML
+"""
+
+import lxml.html
+from lxml import etree
+from cssselect import HTMLTranslator
+from selenium.common.exceptions import NoSuchElementException
+
+
+# Elements that start a new line in rendered text (like WebElement.text)
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'details', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'summary', 'table',
+    'tr', 'ul'
+}
+
+# Elements whose content is never rendered
+SKIP_TAGS = {'head', 'script', 'style', 'noscript', 'template', 'svg'}
+
+_translator = HTMLTranslator()
+_selector_cache = {}
+
+
+def _compile(by, selector):
+    """Translate a (By, selector) pair to a reusable lxml XPath, cached per selector"""
+    key = (by, selector)
+    if key not in _selector_cache:
+        if by in ('css selector', 'tag name'):
+            # Descendants only, like querySelector on a WebElement
+            xpath = _translator.css_to_xpath(selector, prefix='descendant::')
+        elif by == 'xpath':
+            xpath = selector
+        else:
+            raise ValueError(f"Unsupported locator strategy: {by}")
+        _selector_cache[key] = etree.XPath(xpath)
+    return _selector_cache[key]
+
+
+def rendered_text(element):
+    """
+    Approximate the text a browser renders for an element:
+    block elements and <br> break lines, whitespace collapses within a line
+    """
+    parts = []
+
+    def walk(node):
+        if isinstance(node.tag, str):
+            tag = node.tag.lower()
+            if tag not in SKIP_TAGS:
+                is_block = tag in BLOCK_TAGS
+                if is_block or tag == 'br':
+                    parts.append('\n')
+                if node.text:
+                    parts.append(node.text)
+                for child in node:
+                    walk(child)
+                if is_block:
+                    parts.append('\n')
+        if node is not element and node.tail:
+            parts.append(node.tail)
+
+    walk(element)
+
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+class HtmlElement:
+    """lxml element exposing the WebElement methods used by the scrapers"""
+
+    def __init__(self, element):
+        self._element = element
+
+    @property
+    def text(self):
+        return rendered_text(self._element)
+
+    @property
+    def tag_name(self):
+        return self._element.tag
+
+    def get_attribute(self, name):
+        if name == 'textContent':
+            return self._element.text_content()
+        if name == 'outerHTML':
+            return lxml.html.tostring(self._element, encoding='unicode')
+        return self._element.get(name)
+
+    def find_elements(self, by, selector):
+        return [HtmlElement(el) for el in _compile(by, selector)(self._element)]
+
+    def find_element(self, by, selector):
+        matches = _compile(by, selector)(self._element)
+        if not matches:
+            raise NoSuchElementException(f"No element matches {selector}")
+        return HtmlElement(matches[0])
+
+
+class HtmlPage(HtmlElement):
+    """
+    Parsed page standing in for the WebDriver during extraction
+    Build from page_source, an archived snapshot, or a debug dump like page_html.txt
+    """
+
+    def __init__(self, html, url=''):
+        super().__init__(lxml.html.fromstring(html))
+        self.page_source = html
+        self.current_url = url
+
+    @classmethod
+    def from_file(cls, path, url=''):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(f.read(), url=url)
+
+    @property
+    def title(self):
+        title = self._element.find('.//title')
+        return title.text_content().strip() if title is not None else ''
@@ -0,0 +1,67 @@
+"""
+Keyword Matcher
+Aho-Corasick automaton that finds every occurrence of a fixed keyword set
+in a single pass over a text (overlapping and nested keywords included)
+"""
+
+from collections import Counter, deque
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+
+class KeywordMatcher:
+    """
+    Compiled multi-keyword substring matcher
+    Matches exactly what `keyword in text` would, for all keywords at once
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = list(dict.fromkeys(k for k in keywords if k))
+
+        # Trie of the keywords
+        self._goto: List[Dict[str, int]] = [{}]
+        outputs: List[Set[str]] = [set()]
+        for keyword in self.keywords:
+            state = 0
+            for char in keyword:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    outputs.append(set())
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            outputs[state].add(keyword)
+
+        # Failure links, folded into the transitions so a scan never backtracks
+        fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] |= outputs[fail[state]]
+            for char, target in list(self._goto[state].items()):
+                queue.append(target)
+                fail[target] = self._goto[fail[state]].get(char, 0)
+            for char, target in self._goto[fail[state]].items():
+                self._goto[state].setdefault(char, target)
+
+        self._outputs: List[FrozenSet[str]] = [frozenset(keywords) for keywords in outputs]
+
+    def found(self, text: str) -> Set[str]:
+        """Distinct keywords that occur in the text"""
+        goto, outputs = self._goto, self._outputs
+        hits = set()
+        state = 0
+        for char in text:
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                hits |= outputs[state]
+        return hits
+
+    def counts(self, text: str) -> Counter:
+        """Occurrences of each keyword in the text"""
+        goto, outputs = self._goto, self._outputs
+        hits = Counter()
+        state = 0
+        for char in text:
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                hits.update(outputs[state])
+        return hits
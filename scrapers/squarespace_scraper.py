@@ -5,15 +5,22 @@ Handles text-based menus without structured data
 """
 
 from selenium.webdriver.common.by import By
-import time
 import re
 from .base_scraper import BaseScraper
+from .html_parser import HtmlPage
 from .classifier import RestaurantClassifier
 
 
 class SquarespaceScraper(BaseScraper):
     """Scraper for Squarespace-based restaurant sites"""
 
+    # Squarespace menus are server-rendered and rarely show a consent banner
+    COOKIE_TIMEOUT = 1
+
+    # Menu blocks have no stable selector - wait for prices to show up, briefly
+    CONTENT_TEXT_PATTERN = BaseScraper.PRICE_TEXT_PATTERN
+    CONTENT_TIMEOUT = 6
+
     def can_scrape(self, url):
         """Check if URL might be a Squarespace site"""
         # Squarespace sites often have certain patterns
@@ -28,20 +35,17 @@ class SquarespaceScraper(BaseScraper):
         print(f"\n📍 Scraping Squarespace site: {url}")
 
         try:
-            self.driver.get(url)
-            time.sleep(4)
-
-            self.handle_cookie_popup()
-            time.sleep(2)
+            self.load_page(url)
+            page = self.extraction_source(url, restaurant_name=restaurant_name)
 
             # Try to get restaurant name from title or h1
             if not restaurant_name:
-                restaurant_name = self._get_restaurant_name()
+                restaurant_name = self._get_restaurant_name(page)
 
             # Extract menu items
-            menu_items = self._extract_menu_items_text_based()
+            menu_items = self._extract_menu_items_text_based(page)
 
-            restaurant_data = self.get_base_data_structure(restaurant_name, url, menu_items)
+            restaurant_data = self.get_base_data_structure(restaurant_name, url, menu_items, scraped_at=self.fetched_at)
 
             # Add classification
             restaurant_data = RestaurantClassifier.enhance_restaurant_data(restaurant_data)
@@ -62,16 +66,28 @@ class SquarespaceScraper(BaseScraper):
             print(f"✗ Error scraping {url}: {e}")
             return None
 
-    def _get_restaurant_name(self):
+    def parse_html(self, html, url, restaurant_name=None, scraped_at=None):
+        """Extract a restaurant from saved Squarespace page HTML (no browser needed)"""
+        page = HtmlPage(html, url=url)
+
+        restaurant_name = restaurant_name or self._get_restaurant_name(page)
+        menu_items = self._extract_menu_items_text_based(page)
+
+        restaurant_data = self.get_base_data_structure(restaurant_name, url, menu_items, scraped_at=scraped_at)
+        return RestaurantClassifier.enhance_restaurant_data(restaurant_data)
+
+    def _get_restaurant_name(self, page=None):
         """Extract restaurant name"""
+        page = page or self.driver
+
         try:
             # Try title first
-            title = self.driver.title
+            title = page.title
             if title and title != "":
                 return title.split('|')[0].split('-')[0].strip()
 
             # Try h1
-            h1_elements = self.driver.find_elements(By.TAG_NAME, "h1")
+            h1_elements = page.find_elements(By.TAG_NAME, "h1")
             if h1_elements:
                 return h1_elements[0].text.strip()
 
@@ -79,11 +95,13 @@ class SquarespaceScraper(BaseScraper):
         except:
             return "Cafe/Restaurant"
 
-    def _extract_menu_items_text_based(self):
+    def _extract_menu_items_text_based(self, page=None):
         """
         Extract menu items from text-based menus
         Handles simple text lists without structured data
+        page can be the live driver (default) or a parsed HtmlPage
         """
+        page = page or self.driver
         menu_items = []
 
         try:
@@ -100,13 +118,13 @@ class SquarespaceScraper(BaseScraper):
             main_content = None
             for selector in content_selectors:
                 try:
-                    main_content = self.driver.find_element(By.CSS_SELECTOR, selector)
+                    main_content = page.find_element(By.CSS_SELECTOR, selector)
                     break
                 except:
                     continue
 
             if not main_content:
-                main_content = self.driver.find_element(By.TAG_NAME, "body")
+                main_content = page.find_element(By.TAG_NAME, "body")
 
             # Find categories (usually h2, h3, or strong tags)
             categories = main_content.find_elements(By.CSS_SELECTOR, "h2, h3, strong")
@@ -220,18 +238,10 @@ class SquarespaceScraper(BaseScraper):
         print(f"\n📍 Scraping {page_name} page: {url}")
 
         try:
-            self.driver.get(url)
-            time.sleep(4)
-
-            self.handle_cookie_popup()
-            time.sleep(2)
+            self.load_page(url)
 
-            menu_items = self._extract_menu_items_text_based()
-
-            # Add page name to category if not already there
-            for item in menu_items:
-                if item['category'] == "Menu":
-                    item['category'] = page_name
+            page = self.extraction_source(url, restaurant_name=restaurant_name, page_name=page_name)
+            menu_items = self._label_menu_page_items(self._extract_menu_items_text_based(page), page_name)
 
             print(f"✓ Found {len(menu_items)} items on {page_name} page")
 
@@ -240,3 +250,15 @@ class SquarespaceScraper(BaseScraper):
         except Exception as e:
             print(f"✗ Error scraping {url}: {e}")
             return []
+
+    def parse_menu_page_html(self, html, url, page_name="Menu"):
+        """Offline counterpart of scrape_menu_page for saved page HTML"""
+        page = HtmlPage(html, url=url)
+        return self._label_menu_page_items(self._extract_menu_items_text_based(page), page_name)
+
+    def _label_menu_page_items(self, menu_items, page_name):
+        """Add page name to category if not already there"""
+        for item in menu_items:
+            if item['category'] == "Menu":
+                item['category'] = page_name
+        return menu_items
@@ -7,14 +7,100 @@ Includes restaurant discovery by city
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 import time
 from .base_scraper import BaseScraper
+from .html_parser import HtmlPage
 from .classifier import RestaurantClassifier
 
 
+# Walks the whole menu in the browser and returns every item in one round-trip.
+# Mirrors the selector logic of ThuisbezorgdScraper._extract_menu_items_dom.
+MENU_EXTRACTION_JS = """
+const text = el => (el.innerText || '').trim() || (el.textContent || '').trim();
+const items = [];
+
+document.querySelectorAll("section[data-qa*='category']").forEach(section => {
+    const heading = section.querySelector('h2');
+    const category = heading ? (heading.innerText || '').trim() : '';
+
+    const liItems = section.querySelectorAll("li[class*='item-list']");
+
+    if (liItems.length) {
+        // Method 1: items in <li> tags (BABS format)
+        liItems.forEach(li => {
+            let name = '';
+            for (const selector of ['h3', 'strong', "[class*='name']"]) {
+                const el = li.querySelector(selector);
+                if (el) {
+                    name = text(el);
+                    if (name) break;
+                }
+            }
+
+            let price = '';
+            for (const selector of ["[data-qa*='price']", "[class*='price']", 'span']) {
+                const el = li.querySelector(selector);
+                if (el) {
+                    price = text(el);
+                    if (price && (price.includes('€') || price.toLowerCase().includes('from'))) break;
+                }
+            }
+
+            const descEl = li.querySelector("p[class*='description'], div[class*='description']");
+            const description = descEl ? text(descEl) : '';
+
+            if (name && price) {
+                items.push({name: name, category: category, price_raw: price, description: description});
+            }
+        });
+    } else {
+        // Method 2: h3 item names (Pitology/Tasty Thai format)
+        section.querySelectorAll('h3').forEach(h3 => {
+            // Outermost matching ancestor, same as the XPath ancestor lookup in DOM mode
+            let parent = null;
+            for (let node = h3.parentElement; node; node = node.parentElement) {
+                const cls = node.getAttribute('class') || '';
+                const qa = node.getAttribute('data-qa') || '';
+                if (cls.includes('item') || qa.includes('item')) parent = node;
+            }
+            if (!parent) return;
+
+            const name = (h3.innerText || '').trim();
+
+            const priceEl = parent.querySelector("[data-qa*='price']") || parent.querySelector("[class*='price']");
+            const price = priceEl ? (priceEl.innerText || '').trim() : '';
+
+            let description = '';
+            const descEl = parent.querySelector('p');
+            if (descEl) {
+                const descText = (descEl.innerText || '').trim();
+                if (!descText.endsWith('items') && !descText.endsWith('item')) description = descText;
+            }
+
+            if (name && price) {
+                items.push({name: name, category: category, price_raw: price, description: description});
+            }
+        });
+    }
+});
+
+return items;
+"""
+
+
 class ThuisbezorgdScraper(BaseScraper):
     """Enhanced Thuisbezorgd scraper with city-wide discovery"""
 
+    CONTENT_SELECTOR = "section[data-qa*='category']"
+    CONTENT_TIMEOUT = 10
+    SCROLL_TIMEOUT = 3  # max wait for more results after each scroll during discovery
+
+    # 'js' extracts the whole menu with one injected script,
+    # 'dom' walks the elements through WebDriver (slower, kept as a fallback),
+    # 'html' parses page_source offline with lxml
+    EXTRACTION_MODE = 'js'
+
     def can_scrape(self, url):
         """Check if URL is from Thuisbezorgd"""
         return 'thuisbezorgd.nl' in url.lower()
@@ -37,12 +123,12 @@ class ThuisbezorgdScraper(BaseScraper):
         try:
             # Navigate to city page
             url = f"https://www.thuisbezorgd.nl/en/order-takeaway-{city.lower()}"
-            self.driver.get(url)
-            time.sleep(5)
+            self.navigate(url)
+            self.wait_for_document_ready()
 
             # Handle cookie popup
             self.handle_cookie_popup()
-            time.sleep(2)
+            self.wait_for_element("a[href*='/menu/']")
 
             # Scroll to load ALL restaurants
             # Keep scrolling until no new restaurants are found
@@ -56,9 +142,8 @@ class ThuisbezorgdScraper(BaseScraper):
             while True:
                 scroll_iteration += 1
 
-                # Scroll to bottom
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)  # Wait for content to load
+                # Scroll to bottom and wait for more results to load
+                self._scroll_and_wait_for_more()
 
                 # Try multiple selectors for restaurant links
                 selectors = [
@@ -112,39 +197,71 @@ class ThuisbezorgdScraper(BaseScraper):
             print(f"✗ Error discovering restaurants: {e}")
             return []
 
+    def _scroll_and_wait_for_more(self):
+        """Scroll to the bottom and wait until the page grows (or SCROLL_TIMEOUT passes)"""
+        previous_height = self.driver.execute_script("return document.body.scrollHeight")
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+
+        try:
+            WebDriverWait(self.driver, self.SCROLL_TIMEOUT, poll_frequency=0.25).until(
+                lambda driver: driver.execute_script("return document.body.scrollHeight") > previous_height
+            )
+        except TimeoutException:
+            pass
+
     def scrape_restaurant(self, url):
         """Scrape a single restaurant's menu"""
+        try:
+            self.open_restaurant(url)
+            return self.extract_restaurant(url)
+
+        except Exception as e:
+            print(f"✗ Error scraping {url}: {e}")
+            return None
+
+    def open_restaurant(self, url):
+        """Load a restaurant page and wait for its menu, without extracting anything yet"""
         if not self.driver:
             self.start_driver()
 
         print(f"\n📍 Scraping: {url}")
 
-        try:
-            self.driver.get(url)
-            time.sleep(4)
+        self.navigate(url)
+        self.wait_for_document_ready()
 
-            self.handle_cookie_popup()
-            self._handle_closed_popup()
-            time.sleep(2)
+        self.handle_cookie_popup()
+        self._handle_closed_popup()
 
-            restaurant_name = self._get_restaurant_name()
-            menu_items = self._extract_menu_items()
+        # Wait for menu to load
+        self.wait_for_content()
 
-            restaurant_data = self.get_base_data_structure(restaurant_name, url, menu_items)
+    def extract_restaurant(self, url):
+        """Extract and classify the restaurant on the page opened by open_restaurant"""
+        page = self.extraction_source(url)
+        restaurant_name = self._get_restaurant_name(page)
+        menu_items = self._extract_menu_items(page)
 
-            # Add classification data
-            restaurant_data = RestaurantClassifier.enhance_restaurant_data(restaurant_data)
+        restaurant_data = self.get_base_data_structure(restaurant_name, url, menu_items, scraped_at=self.fetched_at)
 
-            self.data.append(restaurant_data)
-            print(f"✓ Scraped {len(menu_items)} items from {restaurant_name}")
-            print(f"  Types: {', '.join(restaurant_data['restaurant_types'])}")
-            print(f"  Price Range: {restaurant_data['price_range']}")
+        # Add classification data
+        restaurant_data = RestaurantClassifier.enhance_restaurant_data(restaurant_data)
 
-            return restaurant_data
+        self.data.append(restaurant_data)
+        print(f"✓ Scraped {len(menu_items)} items from {restaurant_name}")
+        print(f"  Types: {', '.join(restaurant_data['restaurant_types'])}")
+        print(f"  Price Range: {restaurant_data['price_range']}")
 
-        except Exception as e:
-            print(f"✗ Error scraping {url}: {e}")
-            return None
+        return restaurant_data
+
+    def parse_html(self, html, url, restaurant_name=None, scraped_at=None):
+        """Extract a restaurant from saved Thuisbezorgd page HTML (no browser needed)"""
+        page = HtmlPage(html, url=url)
+
+        restaurant_name = restaurant_name or self._get_restaurant_name(page)
+        menu_items = self._extract_menu_items_dom(page)
+
+        restaurant_data = self.get_base_data_structure(restaurant_name, url, menu_items, scraped_at=scraped_at)
+        return RestaurantClassifier.enhance_restaurant_data(restaurant_data)
 
     def _handle_closed_popup(self):
         """Try to close 'restaurant closed' popup"""
@@ -154,14 +271,19 @@ class ThuisbezorgdScraper(BaseScraper):
                 text = button.text.lower()
                 if any(word in text for word in ['x', 'close', 'sluiten']) or button.get_attribute('aria-label') == 'Close':
                     button.click()
-                    time.sleep(1)
+                    try:
+                        WebDriverWait(self.driver, 2).until(EC.invisibility_of_element(button))
+                    except TimeoutException:
+                        pass
                     print("✓ Closed restaurant popup")
                     break
         except:
             pass
 
-    def _get_restaurant_name(self):
+    def _get_restaurant_name(self, page=None):
         """Extract restaurant name from page"""
+        page = page or self.driver
+
         try:
             selectors = [
                 "h1",
@@ -172,7 +294,7 @@ class ThuisbezorgdScraper(BaseScraper):
 
             for selector in selectors:
                 try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
+                    element = page.find_element(By.CSS_SELECTOR, selector)
                     name = element.text.strip()
                     if name:
                         return name
@@ -185,17 +307,44 @@ class ThuisbezorgdScraper(BaseScraper):
             print(f"Warning: Could not extract restaurant name: {e}")
             return "Unknown Restaurant"
 
-    def _extract_menu_items(self):
-        """Extract all menu items with prices"""
+    def _extract_menu_items(self, page=None):
+        """Extract all menu items with prices using the configured extraction mode"""
+        if self.extraction_mode == 'js':
+            try:
+                return self._extract_menu_items_js()
+            except Exception as e:
+                print(f"⚠️  JS extraction failed ({e}), falling back to DOM extraction")
+
+        return self._extract_menu_items_dom(page)
+
+    def _extract_menu_items_js(self):
+        """Extract all menu items in a single execute_script round-trip"""
+        raw_items = self.driver.execute_script(MENU_EXTRACTION_JS) or []
+
+        menu_items = [
+            {
+                'name': item['name'],
+                'category': item['category'],
+                'price': self.clean_price(item['price_raw']),
+                'price_raw': item['price_raw'],
+                'description': item['description']
+            }
+            for item in raw_items
+        ]
+
+        print(f"Extracted {len(menu_items)} menu items (JS mode)")
+        return menu_items
+
+    def _extract_menu_items_dom(self, page=None):
+        """
+        Extract all menu items by walking the elements
+        page can be the live driver (default) or a parsed HtmlPage
+        """
+        page = page or self.driver
         menu_items = []
 
         try:
-            # Wait for menu to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "section[data-qa*='category']"))
-            )
-
-            categories = self.driver.find_elements(By.CSS_SELECTOR, "section[data-qa*='category']")
+            categories = page.find_elements(By.CSS_SELECTOR, "section[data-qa*='category']")
 
             if not categories:
                 print("Warning: No menu categories found")
@@ -219,8 +368,6 @@ class ThuisbezorgdScraper(BaseScraper):
                     if li_items:
                         for li in li_items:
                             try:
-                                time.sleep(0.2)
-
                                 # Find name
                                 name = ""
                                 for selector in ["h3", "strong", "[class*='name']"]:
@@ -0,0 +1,30 @@
+"""
+Menu Price Optimizer - Storage Package
+Local persistence for scraped pages and menu data
+"""
+
+from .jsonl import iter_jsonl, write_jsonl
+from .snapshot_store import SnapshotStore
+from .fingerprint_store import FingerprintStore
+from .job_journal import JobJournal
+from .restaurant_store import RestaurantStore, iter_json_array, write_json_array
+from .price_history import PriceHistory
+from .menu_dataset import write_menu_dataset, read_menu_dataset
+from .menu_database import MenuDatabase
+from .response_cache import ResponseCache
+
+__all__ = [
+    'SnapshotStore',
+    'FingerprintStore',
+    'JobJournal',
+    'RestaurantStore',
+    'PriceHistory',
+    'MenuDatabase',
+    'ResponseCache',
+    'iter_jsonl',
+    'write_jsonl',
+    'iter_json_array',
+    'write_json_array',
+    'write_menu_dataset',
+    'read_menu_dataset'
+]
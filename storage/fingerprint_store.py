@@ -0,0 +1,47 @@
+"""
+Fingerprint Store
+Per-URL fingerprint of the last scrape, so incremental runs can skip unchanged pages
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+
+
+class FingerprintStore:
+    """
+    JSON file mapping url -> fingerprint of the last time the page was checked
+    A fingerprint holds the menu DOM hash, item count and HTTP validators (ETag / Last-Modified)
+    """
+
+    def __init__(self, path='fingerprints.json'):
+        self.path = path
+        self._lock = threading.Lock()
+        self.fingerprints = {}
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.fingerprints = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                print(f"⚠️  Could not read {path} - starting without fingerprints")
+
+    def get(self, url):
+        """Last fingerprint for a URL (None if never scraped)"""
+        return self.fingerprints.get(url)
+
+    def update(self, url, **fields):
+        """Merge new fingerprint fields for a URL and stamp the check time"""
+        with self._lock:
+            fingerprint = self.fingerprints.setdefault(url, {})
+            fingerprint.update({k: v for k, v in fields.items() if v is not None})
+            fingerprint['checked_at'] = datetime.now().isoformat()
+
+    def save(self):
+        """Write all fingerprints to disk (atomically)"""
+        with self._lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.fingerprints, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
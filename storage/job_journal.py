@@ -0,0 +1,142 @@
+"""
+Job Journal
+Append-only on-disk log of a long scrape job so it can resume after a crash
+"""
+
+import glob
+import json
+import os
+import threading
+from datetime import datetime
+
+from .jsonl import iter_jsonl
+
+
+class JobJournal:
+    """
+    One JSONL file per job under jobs/: job parameters, the discovered URL list,
+    and one line per finished URL (with its extracted result)
+    Every line is flushed and fsynced, so at most the restaurant in progress is lost
+    A small job-*.status file beside it (running / finished / superseded) answers
+    "is there anything to resume?" without replaying the journal
+    """
+
+    RUNNING = 'running'
+    FINISHED = 'finished'
+    SUPERSEDED = 'superseded'
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, root='jobs', **params):
+        """
+        Start a new job journal recording its parameters
+        Older unfinished jobs are marked superseded - only the newest job is ever offered for resume
+        """
+        os.makedirs(root, exist_ok=True)
+        job_id = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        for older in cls._journals(root):
+            if older.status() == cls.RUNNING:
+                older._append({'event': cls.SUPERSEDED, 'by': job_id})
+                older._set_status(cls.SUPERSEDED)
+
+        journal = cls(os.path.join(root, f"job-{job_id}.jsonl"))
+        journal._append({'event': 'start', 'job_id': job_id, 'params': params})
+        journal._set_status(cls.RUNNING)
+        return journal
+
+    @classmethod
+    def _journals(cls, root):
+        """Journals under root, newest first"""
+        return [cls(path) for path in sorted(glob.glob(os.path.join(root, 'job-*.jsonl')), reverse=True)]
+
+    @classmethod
+    def latest_unfinished(cls, root='jobs'):
+        """The newest job if it never finished (None if there is nothing to resume) - reads only its status file"""
+        journals = cls._journals(root)
+        if journals and journals[0].status() == cls.RUNNING:
+            return journals[0]
+        return None
+
+    @property
+    def _status_path(self):
+        return f"{os.path.splitext(self.path)[0]}.status"
+
+    def _set_status(self, status):
+        with open(self._status_path, 'w', encoding='utf-8') as f:
+            f.write(status)
+
+    def status(self):
+        """running, finished or superseded (journals from before status files are replayed once)"""
+        try:
+            with open(self._status_path, 'r', encoding='utf-8') as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            state = self.load()
+            status = (self.SUPERSEDED if state['superseded'] else
+                      self.FINISHED if state['finished'] else self.RUNNING)
+            self._set_status(status)
+            return status
+
+    def signature(self):
+        """Changes whenever the journal is appended to (a cache key for its summary)"""
+        stat = os.stat(self.path)
+        return self.path, stat.st_mtime_ns, stat.st_size
+
+    def _append(self, record):
+        record['at'] = datetime.now().isoformat()
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def record_discovered(self, urls):
+        """Record the full list of URLs this job will scrape"""
+        self._append({'event': 'discovered', 'urls': list(urls)})
+
+    def record_result(self, url, result):
+        """Record a finished URL - result None marks it failed (retried on resume)"""
+        if result:
+            self._append({'event': 'done', 'url': url, 'result': result})
+        else:
+            self._append({'event': 'failed', 'url': url})
+
+    def finish(self):
+        """Mark the job complete so it is no longer offered for resume"""
+        self._append({'event': 'finished'})
+        self._set_status(self.FINISHED)
+
+    def load(self):
+        """
+        Replay the journal into the job state:
+        params, urls (None if discovery never finished), results {url: record}, failed, finished, superseded
+        """
+        state = {'params': {}, 'urls': None, 'results': {}, 'failed': set(), 'finished': False,
+                 'superseded': False}
+
+        for record in iter_jsonl(self.path):
+            event = record.get('event')
+            if event == 'start':
+                state['params'] = record.get('params', {})
+            elif event == 'discovered':
+                state['urls'] = record['urls']
+            elif event == 'done':
+                state['results'][record['url']] = record['result']
+                state['failed'].discard(record['url'])
+            elif event == 'failed':
+                state['failed'].add(record['url'])
+            elif event == 'finished':
+                state['finished'] = True
+            elif event == self.SUPERSEDED:
+                state['superseded'] = True
+
+        return state
+
+    def pending_urls(self, state=None):
+        """Discovered URLs without a successful result yet, in discovery order"""
+        state = state or self.load()
+        return [url for url in state['urls'] or [] if url not in state['results']]
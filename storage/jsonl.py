@@ -0,0 +1,38 @@
+"""
+JSONL Files
+Shared reading and writing of the line-per-record logs in storage/
+"""
+
+import json
+import os
+
+
+def iter_jsonl(path):
+    """
+    Stream the records of a JSONL file, skipping blank and unreadable lines
+    (a partially written last line after a crash). A missing file has no records
+    """
+    if not os.path.exists(path):
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def write_jsonl(records, path):
+    """Stream records to a JSONL file, atomically. Returns the number written"""
+    count = 0
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            count += 1
+    os.replace(tmp_path, path)
+    return count
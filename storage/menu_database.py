@@ -0,0 +1,402 @@
+"""
+Menu Database
+Indexed SQLite copy of the menu items the dashboard can query instead of holding
+every item in each session - filters, aggregates, distributions and similarity search run as SQL
+"""
+
+import json
+import math
+import os
+import sqlite3
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+
+from analysis.similarity import SimilarityIndex
+
+
+SCHEMA = """
+CREATE TABLE menu_items (
+    restaurant TEXT NOT NULL,
+    restaurant_types TEXT NOT NULL,
+    price_range TEXT NOT NULL,
+    item_name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    price REAL NOT NULL,
+    description TEXT,
+    search_text TEXT NOT NULL
+);
+CREATE TABLE restaurant_types (
+    restaurant TEXT NOT NULL,
+    restaurant_type TEXT NOT NULL
+);
+CREATE TABLE metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE similarity_grams (
+    gram TEXT PRIMARY KEY,
+    idf REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE similarity_postings (
+    gram TEXT NOT NULL,
+    item INTEGER NOT NULL,
+    weight REAL NOT NULL,
+    PRIMARY KEY (gram, item)
+) WITHOUT ROWID;
+CREATE TEMP TABLE similarity_terms (
+    gram TEXT NOT NULL,
+    item INTEGER NOT NULL,
+    weight REAL NOT NULL
+);
+"""
+
+# Bumped whenever the layout changes - an older file is rebuilt
+SCHEMA_VERSION = 2
+
+# Created after the bulk load - faster than maintaining them row by row
+INDEXES = """
+CREATE INDEX items_category ON menu_items (category, price);
+CREATE INDEX items_restaurant ON menu_items (restaurant);
+CREATE INDEX items_price_range ON menu_items (price_range);
+CREATE INDEX items_price ON menu_items (price);
+CREATE INDEX types_type ON restaurant_types (restaurant_type);
+CREATE INDEX types_restaurant ON restaurant_types (restaurant);
+"""
+
+ITEM_COLUMNS = ['restaurant', 'restaurant_types', 'price_range', 'item_name', 'category', 'price', 'description']
+
+# Sort label -> ORDER BY, matching analysis.ItemTable.SORTS (ties keep price order, then load order)
+ITEM_ORDERS = {
+    'Price: high to low': 'price DESC, rowid',
+    'Price: low to high': 'price ASC, rowid',
+    'Restaurant A-Z': 'lower(restaurant), price DESC, rowid',
+    'Item A-Z': 'lower(item_name), price DESC, rowid'
+}
+
+
+QUARTILES = {'q1': 0.25, 'median': 0.5, 'q3': 0.75}
+
+
+def _quantile_points_sql(name, q):
+    """
+    The two prices a linear-interpolated quantile lies between, and how far along - picked from
+    rows numbered by price (position 0..n-1, group size n) as pandas/numpy do
+    """
+    index = f"(n - 1) * {q}"
+    return (f"MAX(CASE WHEN position = CAST({index} AS INTEGER) THEN price END) AS {name}_low, "
+            f"MAX(CASE WHEN position = CAST({index} AS INTEGER) + 1 THEN price END) AS {name}_high, "
+            f"MAX({index} - CAST({index} AS INTEGER)) AS {name}_fraction")
+
+
+def _quantile_sql(name):
+    """Interpolate between the points (numpy's formula, so results match box_summary)"""
+    low, high, fraction = f"{name}_low", f"COALESCE({name}_high, {name}_low)", f"{name}_fraction"
+    return (f"CASE WHEN {fraction} >= 0.5 THEN {high} - ({high} - {low}) * (1 - {fraction}) "
+            f"ELSE {low} + ({high} - {low}) * {fraction} END AS {name}")
+
+
+# Tukey box statistics per restaurant; the filter goes into {where}
+BOX_SQL = f"""
+    WITH ranked AS (
+        SELECT restaurant, item_name, price,
+               ROW_NUMBER() OVER (PARTITION BY restaurant ORDER BY price) - 1 AS position,
+               COUNT(*) OVER (PARTITION BY restaurant) AS n
+        FROM menu_items{{where}}
+    ),
+    points AS (
+        SELECT restaurant, COUNT(*) AS count, AVG(price) AS mean,
+               {', '.join(_quantile_points_sql(name, q) for name, q in QUARTILES.items())}
+        FROM ranked
+        GROUP BY restaurant
+    ),
+    quartiles AS (
+        SELECT restaurant, count, mean, {', '.join(_quantile_sql(name) for name in QUARTILES)}
+        FROM points
+    ),
+    fenced AS (
+        SELECT r.restaurant, r.item_name, r.price,
+               q.q1 - 1.5 * (q.q3 - q.q1) AS low, q.q3 + 1.5 * (q.q3 - q.q1) AS high
+        FROM ranked r JOIN quartiles q ON q.restaurant = r.restaurant
+    ),
+    whiskers AS (
+        SELECT restaurant, MIN(price) AS lowerfence, MAX(price) AS upperfence
+        FROM fenced
+        WHERE price >= low AND price <= high
+        GROUP BY restaurant
+    )
+"""
+
+
+class MenuDatabase:
+    """
+    Read-only query interface over scraped_menus.db (same methods as analysis.MenuFrame)
+    Holds only menu items with a price, as the dashboard does
+    Each query opens its own connection, so sessions on different threads can share one instance
+    """
+
+    def __init__(self, path='scraped_menus.db'):
+        self.path = path
+
+    def schema_is_current(self):
+        """True if the file exists and was built with this version's layout"""
+        if not os.path.exists(self.path):
+            return False
+        with closing(sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)) as conn:
+            return conn.execute('PRAGMA user_version').fetchone()[0] == SCHEMA_VERSION
+
+    @classmethod
+    def build(cls, restaurants, path='scraped_menus.db', batch_size=5000):
+        """
+        Write the database from restaurant records (streamed), atomically
+        Returns a MenuDatabase for it
+        """
+        tmp_path = f"{path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        total = with_items = with_prices = 0
+        item_count = 0
+        document_frequency = {}
+        with closing(sqlite3.connect(tmp_path)) as conn:
+            conn.executescript(SCHEMA)
+            rows, terms = [], []
+            for restaurant in restaurants:
+                total += 1
+                name = restaurant['restaurant_name']
+                restaurant_types = ', '.join(restaurant.get('restaurant_types', ['restaurant']))
+                price_range = restaurant.get('price_range', 'unknown')
+                menu_items = restaurant.get('menu_items', [])
+                with_items += bool(menu_items)
+
+                priced = [item for item in menu_items if (item.get('price') or 0) > 0]
+                if not priced:
+                    continue
+                with_prices += 1
+
+                for item in priced:
+                    item_count += 1
+                    rows.append((name, restaurant_types, price_range, item['name'], item['category'],
+                                 item['price'], item.get('description', ''), f"{name} {item['name']}".lower()))
+
+                    # Term weights for the similarity index (rowid = insertion order, from 1)
+                    for gram, weight in cls._similarity_terms(item['name'], item.get('description')).items():
+                        terms.append((gram, item_count, weight))
+                        document_frequency[gram] = document_frequency.get(gram, 0) + 1
+
+                memberships = dict.fromkeys(t.strip().lower() for t in restaurant_types.split(','))
+                conn.executemany('INSERT INTO restaurant_types VALUES (?, ?)',
+                                 [(name, t) for t in memberships if t])
+
+                if len(rows) >= batch_size:
+                    conn.executemany('INSERT INTO menu_items VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+                    conn.executemany('INSERT INTO similarity_terms VALUES (?, ?, ?)', terms)
+                    rows, terms = [], []
+
+            conn.executemany('INSERT INTO menu_items VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            conn.executemany('INSERT INTO similarity_terms VALUES (?, ?, ?)', terms)
+            conn.executescript(INDEXES)
+
+            # TF-IDF weights, L2-normalised per item - the same vectors as analysis.SimilarityIndex
+            conn.executemany('INSERT INTO similarity_grams VALUES (?, ?)', [
+                (gram, math.log((1 + item_count) / (1 + frequency)) + 1)
+                for gram, frequency in document_frequency.items()
+            ])
+            conn.create_function('sqrt', 1, math.sqrt, deterministic=True)
+            conn.execute("""
+                INSERT INTO similarity_postings
+                SELECT t.gram, t.item, t.weight * g.idf / norms.norm
+                FROM similarity_terms t
+                JOIN similarity_grams g ON g.gram = t.gram
+                JOIN (
+                    SELECT t.item, sqrt(SUM((t.weight * g.idf) * (t.weight * g.idf))) AS norm
+                    FROM similarity_terms t JOIN similarity_grams g ON g.gram = t.gram
+                    GROUP BY t.item
+                ) norms ON norms.item = t.item
+                ORDER BY t.gram, t.item
+            """)
+            conn.execute('DROP TABLE similarity_terms')
+
+            metadata = {
+                'total_in_file': total,
+                'with_items': with_items,
+                'with_valid_prices': with_prices,
+                'filtered_out': total - with_prices
+            }
+            conn.execute('INSERT INTO metadata VALUES (?, ?)', ('dashboard', json.dumps(metadata)))
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.commit()
+
+        os.replace(tmp_path, path)
+        return cls(path)
+
+    @staticmethod
+    def _similarity_terms(name, description):
+        """Sublinear term weights of an item's name plus down-weighted description n-grams"""
+        terms = SimilarityIndex._term_weights(name or '')
+        for gram, weight in SimilarityIndex._term_weights(description or '').items():
+            terms[gram] = terms.get(gram, 0) + SimilarityIndex.DESCRIPTION_WEIGHT * weight
+        return {gram: float(weight) for gram, weight in terms.items()}
+
+    def _query(self, sql, params=()):
+        with closing(sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)) as conn:
+            return pd.read_sql_query(sql, conn, params=params)
+
+    @staticmethod
+    def _where(categories=None, restaurants=None, price_range=None, search=None):
+        """WHERE clause and parameters for the dashboard filters"""
+        clauses, params = [], []
+        if categories:
+            clauses.append(f"category IN ({', '.join('?' * len(categories))})")
+            params.extend(categories)
+        if restaurants is not None:
+            clauses.append(f"restaurant IN ({', '.join('?' * len(restaurants))})" if restaurants else '0')
+            params.extend(restaurants)
+        if price_range:
+            clauses.append('price_range = ?')
+            params.append(price_range)
+        if search and search.strip():
+            clauses.append('instr(search_text, ?) > 0')
+            params.append(search.strip().lower())
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def metadata(self):
+        """Restaurant counts for the data-quality notes"""
+        row = self._query("SELECT value FROM metadata WHERE key = 'dashboard'")
+        return json.loads(row['value'].iloc[0])
+
+    def categories(self):
+        """All item categories, sorted"""
+        return self._query('SELECT DISTINCT category FROM menu_items ORDER BY category')['category'].tolist()
+
+    def items(self, categories=None, restaurants=None, price_range=None, columns=None):
+        """Items matching the filters (only the requested columns)"""
+        columns = [c for c in (columns or ITEM_COLUMNS) if c in ITEM_COLUMNS]
+        where, params = self._where(categories, restaurants, price_range)
+        return self._query(f"SELECT {', '.join(columns)} FROM menu_items{where} ORDER BY rowid", params)
+
+    def price_stats(self, categories=None):
+        """count / mean / min / max of item prices for a category selection"""
+        where, params = self._where(categories)
+        row = self._query(
+            f"SELECT COUNT(*) AS count, AVG(price) AS mean, MIN(price) AS min, MAX(price) AS max FROM menu_items{where}",
+            params
+        ).iloc[0]
+        return {'count': int(row['count']), 'mean': row['mean'], 'min': row['min'], 'max': row['max']}
+
+    def cube_cells(self):
+        """Cells of analysis.AggregateCube, aggregated in SQL"""
+        return self._query("""
+            SELECT restaurant, restaurant_types, price_range, category,
+                   COUNT(price) AS count, SUM(price) AS sum, MIN(price) AS min, MAX(price) AS max,
+                   SUM(price * price) AS sumsq
+            FROM menu_items
+            GROUP BY restaurant, restaurant_types, price_range, category
+        """)
+
+    def price_boxes(self, categories=None, top_n=20):
+        """
+        Box statistics per restaurant (as analysis.box_summary, sorted by median) and the
+        top_n items furthest outside their restaurant's whiskers (as analysis.box_outliers)
+        """
+        where, params = self._where(categories)
+        summary = self._query(BOX_SQL.format(where=where) + """
+            SELECT q.restaurant, q.q1, q.median, q.q3, q.count, q.mean, w.lowerfence, w.upperfence
+            FROM quartiles q LEFT JOIN whiskers w ON w.restaurant = q.restaurant
+            ORDER BY q.median DESC
+        """, params).set_index('restaurant')
+
+        outliers = self._query(BOX_SQL.format(where=where) + """
+            SELECT f.restaurant, f.item_name, f.price
+            FROM fenced f JOIN whiskers w ON w.restaurant = f.restaurant
+            WHERE MAX(w.lowerfence - f.price, f.price - w.upperfence) > 0
+            ORDER BY MAX(w.lowerfence - f.price, f.price - w.upperfence) DESC
+            LIMIT ?
+        """, params + [top_n])
+        return summary, outliers
+
+    def histogram(self, restaurants=None, price_range=None, bins=15):
+        """
+        Equal-width price bins (as analysis.histogram_bins): the edges come from MIN/MAX,
+        the counts from one pass with a CASE bucket per bin
+        """
+        where, params = self._where(restaurants=restaurants, price_range=price_range)
+        low, high = self._query(f"SELECT MIN(price) AS low, MAX(price) AS high FROM menu_items{where}",
+                                params).iloc[0]
+        if pd.isna(low):
+            return pd.DataFrame(columns=['bin_start', 'bin_end', 'count'])
+
+        _, edges = np.histogram([low, high], bins=bins)
+        buckets = [
+            f"SUM(CASE WHEN price >= ? AND price {'<=' if i == bins - 1 else '<'} ? THEN 1 ELSE 0 END)"
+            for i in range(bins)
+        ]
+        edge_params = [float(edge) for i in range(bins) for edge in (edges[i], edges[i + 1])]
+        counts = self._query(f"SELECT {', '.join(buckets)} FROM menu_items{where}", edge_params + params)
+        return pd.DataFrame({'bin_start': edges[:-1], 'bin_end': edges[1:],
+                             'count': counts.iloc[0].fillna(0).astype(int).to_numpy()})
+
+    def similarity_index(self):
+        """Like-for-like item search answered from the on-disk postings (see SimilarityTable)"""
+        return SimilarityTable(self)
+
+    def type_memberships(self):
+        """(restaurant, restaurant_type) rows for analysis.TypeIndex"""
+        memberships = self._query('SELECT restaurant, restaurant_type FROM restaurant_types ORDER BY rowid')
+        memberships['restaurant_type'] = memberships['restaurant_type'].astype('category')
+        return memberships
+
+    def item_page(self, categories=None, search='', sort='Price: high to low', page=1, page_size=50):
+        """One page of items for the competitor table, plus the total number of matches"""
+        where, params = self._where(categories, search=search)
+        total = int(self._query(f"SELECT COUNT(*) AS total FROM menu_items{where}", params)['total'].iloc[0])
+        rows = self._query(
+            f"SELECT restaurant, item_name, category, price FROM menu_items{where} "
+            f"ORDER BY {ITEM_ORDERS[sort]} LIMIT ? OFFSET ?",
+            params + [page_size, (page - 1) * page_size]
+        )
+        return rows, total
+
+
+class SimilarityTable:
+    """
+    analysis.SimilarityIndex kept on disk: TF-IDF postings in scraped_menus.db, scored in SQL
+    A query reads only the postings of its own n-grams
+    """
+
+    def __init__(self, database):
+        self.database = database
+
+    def __len__(self):
+        return int(self.database._query('SELECT COUNT(*) AS n FROM menu_items')['n'].iloc[0])
+
+    def query(self, text, k=25, min_similarity=0.0):
+        """The k items most similar to the text (cosine similarity, best first) with a 'similarity' column"""
+        columns = ['restaurant', 'item_name', 'category', 'price']
+        term_weights = SimilarityIndex._term_weights(text)
+        grams = list(term_weights)
+        idf = dict(self.database._query(
+            f"SELECT gram, idf FROM similarity_grams WHERE gram IN ({', '.join('?' * len(grams))})", grams
+        ).itertuples(index=False)) if grams else {}
+        if not idf:
+            return pd.DataFrame(columns=columns + ['similarity'])
+
+        weights = {gram: term_weights[gram] * idf[gram] for gram in idf}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        values = ', '.join('(?, ?)' for _ in weights)
+        params = [value for gram, weight in weights.items() for value in (gram, weight / norm)]
+
+        return self.database._query(f"""
+            WITH query_terms(gram, weight) AS (VALUES {values}),
+            scores AS (
+                SELECT p.item, SUM(p.weight * q.weight) AS similarity
+                FROM query_terms q JOIN similarity_postings p ON p.gram = q.gram
+                GROUP BY p.item
+            )
+            SELECT {', '.join('m.' + c for c in columns)}, s.similarity
+            FROM scores s JOIN menu_items m ON m.rowid = s.item
+            WHERE s.similarity > ?
+            ORDER BY s.similarity DESC, s.item
+            LIMIT ?
+        """, params + [min_similarity, k])
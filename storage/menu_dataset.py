@@ -0,0 +1,112 @@
+"""
+Menu Dataset
+Flat, typed columnar copy of the scraped menus (one row per menu item) for fast dashboard loads
+Needs pyarrow - callers fall back to the JSONL store when it is not installed
+"""
+
+import os
+
+import pandas as pd
+
+from scrapers.classifier import RestaurantClassifier
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+# Low-cardinality columns stored dictionary-encoded (read back as pandas categoricals)
+CATEGORICAL_COLUMNS = ['restaurant', 'restaurant_types', 'price_range', 'category']
+STRING_COLUMNS = ['restaurant_url', 'item_name', 'description', 'scraped_at']
+
+
+def columnar_available():
+    """True if pyarrow is installed"""
+    return pa is not None
+
+
+def write_menu_dataset(restaurants, path='scraped_menus.parquet'):
+    """
+    Flatten restaurant records into one row per menu item and write them as Parquet
+    Items without a category and restaurants without a price range (records never classified,
+    or edited by hand) are classified here, vectorised over the whole dataset
+    Returns the number of restaurants written (also kept in the file's metadata)
+    """
+    if pa is None:
+        print("⚠️  pyarrow not installed - skipping columnar dataset")
+        return 0
+
+    columns = {name: [] for name in CATEGORICAL_COLUMNS + STRING_COLUMNS}
+    prices = []
+    positions = []
+    total_restaurants = 0
+
+    for restaurant in restaurants:
+        total_restaurants += 1
+        restaurant_types = ', '.join(restaurant.get('restaurant_types', ['restaurant']))
+        price_range = restaurant.get('price_range', '')
+
+        for item in restaurant['menu_items']:
+            positions.append(total_restaurants)
+            columns['restaurant'].append(restaurant['restaurant_name'])
+            columns['restaurant_types'].append(restaurant_types)
+            columns['price_range'].append(price_range)
+            columns['category'].append(item.get('category', ''))
+            columns['restaurant_url'].append(restaurant.get('url', ''))
+            columns['item_name'].append(item['name'])
+            columns['description'].append(item.get('description', ''))
+            columns['scraped_at'].append(restaurant.get('scraped_at', ''))
+            prices.append(item['price'])
+
+    columns['category'] = RestaurantClassifier.categorize_menu_items(
+        pd.Series(columns['item_name'], dtype=object), pd.Series(columns['category'], dtype=object)
+    ).tolist()
+
+    unclassified = [row for row, price_range in enumerate(columns['price_range']) if not price_range]
+    if unclassified:
+        items = pd.DataFrame({'restaurant': positions, 'price': pd.to_numeric(pd.Series(prices), errors='coerce')})
+        ranges = RestaurantClassifier.classify_price_ranges(items)['range']
+        for row in unclassified:
+            columns['price_range'][row] = ranges[positions[row]]
+
+    arrays = {}
+    for name in CATEGORICAL_COLUMNS:
+        arrays[name] = pa.array(columns[name], type=pa.string()).dictionary_encode()
+    for name in STRING_COLUMNS:
+        arrays[name] = pa.array(columns[name], type=pa.string())
+    arrays['price'] = pa.array(prices, type=pa.float64())
+
+    table = pa.table(arrays).replace_schema_metadata({'total_restaurants': str(total_restaurants)})
+
+    tmp_path = f"{path}.tmp"
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+
+    return total_restaurants
+
+
+def dataset_is_current(path, source_path):
+    """True if the dataset exists and is at least as new as the file it was built from"""
+    if not os.path.exists(path):
+        return False
+    return not os.path.exists(source_path) or os.path.getmtime(path) >= os.path.getmtime(source_path)
+
+
+def read_menu_dataset(path='scraped_menus.parquet', columns=None):
+    """
+    Memory-map the dataset, reading only the requested columns
+    Categorical columns get their categories sorted, so sorting by them is alphabetical
+    (the dictionary keeps them in order of first appearance)
+    Returns (DataFrame, total restaurants in the source data)
+    """
+    table = pq.read_table(path, columns=columns, memory_map=True)
+    metadata = table.schema.metadata or {}
+    total_restaurants = int(metadata.get(b'total_restaurants', 0))
+
+    df = table.to_pandas()
+    for name in df.select_dtypes('category').columns:
+        df[name] = df[name].cat.reorder_categories(sorted(df[name].cat.categories))
+    return df, total_restaurants
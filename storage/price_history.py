@@ -0,0 +1,181 @@
+"""
+Price History
+Append-only SQLite log of every observed item price, so price moves survive re-scrapes
+"""
+
+import hashlib
+import os
+import sqlite3
+import statistics
+import threading
+from datetime import datetime
+from itertools import groupby
+
+from scrapers.dedup import normalize_item_name
+from .restaurant_store import RestaurantStore
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    item_id TEXT PRIMARY KEY,
+    restaurant_url TEXT NOT NULL,
+    restaurant_name TEXT NOT NULL,
+    item_name TEXT NOT NULL,
+    normalized_name TEXT NOT NULL,
+    category TEXT
+);
+CREATE INDEX IF NOT EXISTS items_restaurant ON items (restaurant_url);
+CREATE INDEX IF NOT EXISTS items_name ON items (normalized_name);
+
+CREATE TABLE IF NOT EXISTS observations (
+    item_id TEXT NOT NULL,
+    observed_at TEXT NOT NULL,
+    price REAL NOT NULL,
+    PRIMARY KEY (item_id, observed_at)
+) WITHOUT ROWID;
+"""
+
+
+class PriceHistory:
+    """
+    One row per (item, scrape time) with the price seen
+    An item keeps its identity across scrapes: hash of restaurant URL + normalised item name
+    Re-recording the same scrape (e.g. records carried forward by incremental runs) is a no-op
+    Queries start from the items table and seek into each item's (item_id, observed_at) key range,
+    so their cost follows the number of items, not the years of observations
+    """
+
+    def __init__(self, path='price_history.db', seed_from='scraped_menus.jsonl'):
+        self.path = path
+        self._lock = threading.Lock()
+
+        is_new = not os.path.exists(path)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+
+        # First run: every record still in the JSONL log (superseded ones included) becomes history
+        if is_new and seed_from and os.path.exists(seed_from):
+            count = self.record_many(RestaurantStore(seed_from, seed_from=None).records())
+            print(f"✓ Seeded {path} with {count} restaurant scrapes from {seed_from}")
+
+    @staticmethod
+    def item_id(restaurant_url, item_name):
+        """Stable identity of an item across scrapes"""
+        key = f"{restaurant_url}|{normalize_item_name(item_name)}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+    def record(self, restaurant):
+        """Add the prices of one scraped restaurant record"""
+        self.record_many([restaurant])
+
+    def record_many(self, restaurants):
+        """Add the prices of several scraped restaurant records in one transaction. Returns how many"""
+        count = 0
+        with self._lock, self._conn:
+            for restaurant in restaurants:
+                count += 1
+                url = restaurant.get('url') or restaurant.get('restaurant_name', '')
+                observed_at = restaurant.get('scraped_at') or datetime.now().isoformat()
+
+                items, observations = [], []
+                for item in restaurant.get('menu_items', []):
+                    price = item.get('price')
+                    if not isinstance(price, (int, float)) or price <= 0:
+                        continue
+                    item_id = self.item_id(url, item['name'])
+                    items.append((item_id, url, restaurant.get('restaurant_name', ''), item['name'],
+                                  normalize_item_name(item['name']), item.get('category')))
+                    observations.append((item_id, observed_at, price))
+
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?)', items
+                )
+                self._conn.executemany(
+                    'INSERT OR IGNORE INTO observations VALUES (?, ?, ?)', observations
+                )
+        return count
+
+    def item_history(self, restaurant_url, item_name):
+        """[(observed_at, price)] for one item, oldest first"""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT observed_at, price FROM observations WHERE item_id = ? ORDER BY observed_at',
+                (self.item_id(restaurant_url, item_name),)
+            ).fetchall()
+
+    def weekly_median(self, name_contains, start=None, end=None, restaurant_urls=None):
+        """
+        Median price per week (weeks start on Monday) of items whose name contains the text,
+        e.g. weekly_median('cappuccino', start='2025-01-01')
+        Returns [(week_start, median_price, observations)]
+        """
+        query = """
+            SELECT date(substr(o.observed_at, 1, 10), '-6 days', 'weekday 1') AS week, o.price
+            FROM items i CROSS JOIN observations o ON o.item_id = i.item_id
+            WHERE i.normalized_name LIKE ?
+        """
+        params = [f"%{normalize_item_name(name_contains)}%"]
+        if start:
+            query += ' AND o.observed_at >= ?'
+            params.append(str(start))
+        if end:
+            query += ' AND o.observed_at <= ?'
+            params.append(self._end_of(end))
+        if restaurant_urls:
+            query += f" AND i.restaurant_url IN ({', '.join('?' * len(restaurant_urls))})"
+            params.extend(restaurant_urls)
+        query += ' ORDER BY week'
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        result = []
+        for week, group in groupby(rows, key=lambda row: row[0]):
+            prices = [price for _, price in group]
+            result.append((week, statistics.median(prices), len(prices)))
+        return result
+
+    def price_changes(self, since, min_change=0.10, until=None):
+        """
+        Items whose price changed by at least min_change (0.10 = +10%, -0.10 = a 10% drop) since a date
+        Compares the latest price in the window with the last price before it (or the first in it)
+        Returns [{restaurant_name, restaurant_url, item_name, old_price, new_price, change}], biggest first
+        """
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT restaurant_name, restaurant_url, item_name, old_price, new_price,
+                       new_price / old_price - 1 AS change
+                FROM (
+                    SELECT i.restaurant_name, i.restaurant_url, i.item_name,
+                           (SELECT n.price FROM observations n
+                            WHERE n.item_id = i.item_id AND n.observed_at >= :since AND n.observed_at <= :until
+                            ORDER BY n.observed_at DESC LIMIT 1) AS new_price,
+                           COALESCE(
+                               (SELECT b.price FROM observations b
+                                WHERE b.item_id = i.item_id AND b.observed_at < :since
+                                ORDER BY b.observed_at DESC LIMIT 1),
+                               (SELECT f.price FROM observations f
+                                WHERE f.item_id = i.item_id AND f.observed_at >= :since
+                                ORDER BY f.observed_at LIMIT 1)
+                           ) AS old_price
+                    FROM items i
+                )
+                WHERE old_price > 0
+                  AND (CASE WHEN :min_change >= 0 THEN new_price / old_price - 1 >= :min_change
+                            ELSE new_price / old_price - 1 <= :min_change END)
+                ORDER BY ABS(change) DESC
+            """, {'since': str(since), 'until': self._end_of(until), 'min_change': min_change}).fetchall()
+
+        columns = ['restaurant_name', 'restaurant_url', 'item_name', 'old_price', 'new_price', 'change']
+        return [dict(zip(columns, row)) for row in rows]
+
+    @staticmethod
+    def _end_of(moment):
+        """Upper bound for observed_at: a bare date includes the whole day, None means no bound"""
+        if not moment:
+            return '9999'
+        moment = str(moment)
+        return moment + 'T99' if len(moment) == 10 else moment
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,212 @@
+"""
+Restaurant Store
+Append-only JSONL log of scraped restaurants, streamed instead of rewritten
+"""
+
+import json
+import os
+import threading
+
+from .jsonl import iter_jsonl
+
+
+def _snapshot_entry(record, first):
+    """One record as it appears inside a json.dump(..., indent=2) array"""
+    pretty = json.dumps(record, indent=2, ensure_ascii=False)
+    return ('\n' if first else ',\n') + '\n'.join('  ' + line for line in pretty.split('\n'))
+
+
+def iter_json_array(path, chunk_size=1 << 16):
+    """Stream the records of a JSON array file one at a time instead of loading it whole"""
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = f.read(chunk_size).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError(f"{path} is not a JSON array")
+        buffer = buffer[1:]
+        eof = False
+
+        while True:
+            buffer = buffer.lstrip().lstrip(',').lstrip()
+            if buffer.startswith(']'):
+                return
+            try:
+                record, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                # Record continues past the buffered text
+                if eof:
+                    raise
+                more = f.read(chunk_size)
+                eof = not more
+                buffer += more
+                continue
+            yield record
+            buffer = buffer[end:]
+
+
+def write_json_array(records, path):
+    """
+    Stream records to a JSON array file (same layout as json.dump(..., indent=2)), atomically
+    Returns the number of records written
+    """
+    count = 0
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for record in records:
+            f.write(_snapshot_entry(record, first=not count))
+            count += 1
+        f.write('\n]' if count else ']')
+    os.replace(tmp_path, path)
+    return count
+
+
+class RestaurantStore:
+    """
+    One restaurant record per line in scraped_menus.jsonl, appended as each scrape finishes
+    A later line for the same URL supersedes earlier ones; compact() drops superseded lines
+    and writes the canonical scraped_menus.json snapshot
+    A snapshot rewritten by something else (e.g. scraper.py, a git checkout) is merged into the log:
+    its records are appended only where they are newer (scraped_at) than the log's, never replacing it
+    Reading never holds more than one record plus a line-number index in memory
+    """
+
+    def __init__(self, path='scraped_menus.jsonl', seed_from='scraped_menus.json'):
+        self.path = path
+        self.seed_from = seed_from
+        self._lock = threading.Lock()
+
+        # First run, or the snapshot changed since it was last merged: bring in its newer records
+        if seed_from and os.path.exists(seed_from) and self._snapshot_changed():
+            with self._lock:
+                count = self._merge_snapshot()
+                self._mark_merged()
+            if count:
+                print(f"✓ Merged {count} restaurants into {path} from {seed_from}")
+
+    @property
+    def _marker_path(self):
+        """Records the (mtime, size) of the snapshot last merged into or written from the log"""
+        return f"{self.path}.seed"
+
+    def _snapshot_signature(self):
+        stat = os.stat(self.seed_from)
+        return f"{stat.st_mtime_ns} {stat.st_size}"
+
+    def _snapshot_changed(self):
+        """True if the log is missing or the snapshot differs from the one last merged"""
+        if not os.path.exists(self.path):
+            return True
+        try:
+            with open(self._marker_path, 'r', encoding='utf-8') as f:
+                return f.read().strip() != self._snapshot_signature()
+        except FileNotFoundError:
+            return True
+
+    def _mark_merged(self):
+        with open(self._marker_path, 'w', encoding='utf-8') as f:
+            f.write(self._snapshot_signature())
+
+    def _merge_snapshot(self, batch_size=500):
+        """
+        Append the snapshot's records that are new, or scraped later than the log's current record
+        for the same restaurant - records appended since the last compaction always survive
+        Returns the number appended
+        """
+        scraped_at = {}
+        for record in self.records():
+            scraped_at[self._key(record)] = record.get('scraped_at') or ''
+
+        count = 0
+        batch = []
+        for record in iter_json_array(self.seed_from):
+            key = self._key(record)
+            if key in scraped_at and (record.get('scraped_at') or '') <= scraped_at[key]:
+                continue
+            batch.append(record)
+            if len(batch) >= batch_size:
+                count += self._write_lines(batch)
+                batch = []
+        return count + self._write_lines(batch)
+
+    @staticmethod
+    def _key(record):
+        return record.get('url') or record.get('restaurant_name')
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def append(self, record):
+        """Append one restaurant record"""
+        self.extend([record])
+
+    def extend(self, records):
+        """Append several restaurant records in one write"""
+        with self._lock:
+            self._write_lines(records)
+
+    def _write_lines(self, records):
+        """Append records to the log (caller holds the lock). Returns the number written"""
+        lines = [json.dumps(record, ensure_ascii=False) + '\n' for record in records]
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(''.join(lines))
+            f.flush()
+        return len(lines)
+
+    def _lines(self):
+        """(position, record) for every readable line"""
+        return enumerate(iter_jsonl(self.path))
+
+    def records(self):
+        """Stream every record in the log, superseded ones included"""
+        for _, record in self._lines():
+            yield record
+
+    def _latest_line_numbers(self):
+        latest = {}
+        for line_no, record in self._lines():
+            latest[self._key(record)] = line_no
+        return set(latest.values())
+
+    def latest(self):
+        """Stream the current record per restaurant (two passes, no full load)"""
+        keep = self._latest_line_numbers()
+        for line_no, record in self._lines():
+            if line_no in keep:
+                yield record
+
+    def compact(self, snapshot_path='scraped_menus.json'):
+        """
+        Rewrite the log with only the current record per restaurant and write the
+        JSON snapshot (same layout as json.dump(..., indent=2)) from it
+        Returns the number of restaurants
+        """
+        with self._lock:
+            count = 0
+            log_tmp = f"{self.path}.tmp"
+            snapshot_tmp = f"{snapshot_path}.tmp" if snapshot_path else None
+
+            snapshot = open(snapshot_tmp, 'w', encoding='utf-8') if snapshot_tmp else None
+            try:
+                with open(log_tmp, 'w', encoding='utf-8') as log:
+                    if snapshot:
+                        snapshot.write('[')
+                    for record in self.latest():
+                        log.write(json.dumps(record, ensure_ascii=False) + '\n')
+                        if snapshot:
+                            snapshot.write(_snapshot_entry(record, first=not count))
+                        count += 1
+                    if snapshot:
+                        snapshot.write('\n]' if count else ']')
+            finally:
+                if snapshot:
+                    snapshot.close()
+
+            os.replace(log_tmp, self.path)
+            if snapshot_tmp:
+                os.replace(snapshot_tmp, snapshot_path)
+                # The snapshot came from the log - nothing in it to merge back
+                if self.seed_from and os.path.abspath(snapshot_path) == os.path.abspath(self.seed_from):
+                    self._mark_merged()
+
+        return count
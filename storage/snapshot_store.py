@@ -0,0 +1,87 @@
+"""
+Snapshot Store
+Content-addressed archive of raw fetched pages
+Lets extraction be re-run over old pages without touching the network
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+from .jsonl import iter_jsonl
+
+
+class SnapshotStore:
+    """
+    Archive of fetched page HTML
+    Pages are gzip-compressed under objects/<hash[:2]>/<hash>.html.gz and deduplicated
+    by SHA-256 of the HTML. index.jsonl records every fetch (url, fetched_at, hash).
+    """
+
+    def __init__(self, root='snapshots'):
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        self.index_path = os.path.join(root, 'index.jsonl')
+        self._lock = threading.Lock()
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+    def _object_path(self, sha256):
+        return os.path.join(self.objects_dir, sha256[:2], f"{sha256}.html.gz")
+
+    def save(self, url, html, fetched_at=None, **metadata):
+        """
+        Archive a fetched page and record the fetch in the index
+        Extra keyword arguments (scraper, restaurant_name, ...) are stored with the entry
+        Returns the content hash
+        """
+        data = html.encode('utf-8')
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self._object_path(sha256)
+
+        # Identical pages are stored once
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        entry = {
+            'url': url,
+            'fetched_at': fetched_at or datetime.now().isoformat(),
+            'sha256': sha256,
+            'size': len(data)
+        }
+        entry.update({k: v for k, v in metadata.items() if v is not None})
+
+        with self._lock:
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+        return sha256
+
+    def load(self, sha256):
+        """Return the archived HTML for a content hash"""
+        with gzip.open(self._object_path(sha256), 'rb') as f:
+            return f.read().decode('utf-8')
+
+    def entries(self):
+        """Iterate over every recorded fetch, oldest first"""
+        return iter_jsonl(self.index_path)
+
+    def latest(self, until=None):
+        """
+        Most recent fetch per URL
+        until: optional ISO timestamp - ignore fetches after it (replay an older snapshot)
+        """
+        latest = {}
+        for entry in self.entries():
+            if until and entry['fetched_at'] > until:
+                continue
+            current = latest.get(entry['url'])
+            if current is None or entry['fetched_at'] >= current['fetched_at']:
+                latest[entry['url']] = entry
+        return latest
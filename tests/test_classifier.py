@@ -0,0 +1,81 @@
+"""
+Vectorised classifier methods must agree with the per-item / per-restaurant ones
+"""
+
+import copy
+import random
+
+import pandas as pd
+
+from reclassify import reclassify_batch
+from scrapers.classifier import RestaurantClassifier
+
+
+WORDS = [
+    'Pizza', 'Margherita', 'Burger', 'Cheeseburger', 'Salad', 'Salade', 'Ice Cream', 'Coffee', 'Tea',
+    'Pancake', 'Penne', 'Poke Bowl', 'Soep', 'Wrap', 'Fries', 'Water', 'Chicken', 'Spicy', 'Large',
+    'Falafel', 'Mango Juice', 'Cake', 'Starter', 'Side', 'Nachos', 'Bowl', 'PIZZA', 'Sweet'
+]
+CATEGORIES = ['', '', '', 'Other', 'Burgers', 'Specials', '  ']
+
+
+def make_restaurants(count=40, seed=7):
+    rng = random.Random(seed)
+    restaurants = []
+    for number in range(count):
+        items = [
+            {
+                'name': ' '.join(rng.sample(WORDS, rng.randint(1, 3))),
+                'price': rng.choice([None, 0, round(rng.uniform(1, 40), 2), 27.315, 8, 15.0, 25]),
+                'category': rng.choice(CATEGORIES)
+            }
+            for _ in range(rng.randint(0, 25))
+        ]
+        restaurants.append({'restaurant_name': f"{rng.choice(WORDS)} House {number}", 'menu_items': items})
+    return restaurants
+
+
+def test_categorize_menu_items_matches_scalar():
+    items = [item for restaurant in make_restaurants() for item in restaurant['menu_items']]
+    names = pd.Series([item['name'] for item in items] + [None, ''], index=[0] * (len(items) + 2))
+    existing = pd.Series([item['category'] for item in items] + ['', None], index=names.index)
+
+    vectorised = RestaurantClassifier.categorize_menu_items(names, existing)
+    # The scalar method takes strings - missing values become ''
+    scalar = [
+        RestaurantClassifier.categorize_menu_item(name if isinstance(name, str) else '',
+                                                  category if isinstance(category, str) else '')
+        for name, category in zip(names, existing)
+    ]
+    assert vectorised.tolist() == scalar
+    assert vectorised.index.equals(names.index)
+
+
+def test_classify_price_ranges_matches_scalar():
+    restaurants = make_restaurants()
+    items = pd.DataFrame(
+        [
+            (restaurant['restaurant_name'], item['price'])
+            for restaurant in restaurants
+            for item in restaurant['menu_items']
+        ],
+        columns=['restaurant', 'price']
+    )
+    items['price'] = pd.to_numeric(items['price'], errors='coerce')
+
+    vectorised = RestaurantClassifier.classify_price_ranges(items)
+    for restaurant in restaurants:
+        if not restaurant['menu_items']:
+            continue
+        expected = RestaurantClassifier.classify_price_range(restaurant['menu_items'])
+        assert vectorised.loc[restaurant['restaurant_name']].to_dict() == expected
+
+
+def test_reclassify_batch_matches_enhance_restaurant_data():
+    restaurants = make_restaurants()
+    restaurants[0]['menu_items'].append({'name': 'Penne', 'price': 9.5, 'category': 'Mains',
+                                         'category_source': 'keywords'})
+
+    for restaurant, (record, *_) in zip(restaurants, reclassify_batch(restaurants)):
+        expected = RestaurantClassifier.enhance_restaurant_data(copy.deepcopy(restaurant))
+        assert record == expected
@@ -0,0 +1,62 @@
+"""
+Menu item deduplication: which repeated items merge, and which stay apart
+"""
+
+from scrapers.dedup import dedupe_menu_items, normalize_item_name
+
+
+def item(name, price, description=''):
+    return {'name': name, 'price': price, 'description': description, 'category': 'Mains'}
+
+
+def names(items):
+    return [entry['name'] for entry in items]
+
+
+def test_normalize_item_name():
+    assert normalize_item_name('  Crème-Brûlée!! ') == 'creme brulee'
+    assert normalize_item_name(None) == ''
+
+
+def test_exact_repeat_is_merged():
+    items = [item('Margherita', 9.5), item('margherita', 9.5), item('Pepperoni', 11.0)]
+    assert names(dedupe_menu_items(items)) == ['Margherita', 'Pepperoni']
+
+
+def test_reordered_words_are_merged():
+    items = [item('Chicken Burger Spicy', 12.5), item('Spicy Chicken Burger', 12.5)]
+    assert names(dedupe_menu_items(items)) == ['Chicken Burger Spicy']
+
+
+def test_near_identical_names_are_merged():
+    items = [item('Margherita Pizza', 9.5), item('Margarita Pizza', 9.5)]
+    assert names(dedupe_menu_items(items)) == ['Margherita Pizza']
+
+
+def test_description_is_carried_over_from_duplicate():
+    items = [item('Caesar Salad', 10.0), item('Caesar Salad', 10.0, 'Romaine, parmesan, croutons')]
+    unique = dedupe_menu_items(items)
+    assert len(unique) == 1
+    assert unique[0]['description'] == 'Romaine, parmesan, croutons'
+    # The input items are not modified
+    assert items[0]['description'] == ''
+
+
+def test_numbered_items_stay_apart():
+    items = [item('Menu 1', 15.0), item('Menu 2', 15.0), item('Menu 12', 15.0)]
+    assert names(dedupe_menu_items(items)) == ['Menu 1', 'Menu 2', 'Menu 12']
+
+
+def test_different_prices_stay_apart():
+    items = [item('Cappuccino', 3.2), item('Cappuccino', 3.8), item('Cappuccino', None)]
+    assert len(dedupe_menu_items(items)) == 3
+
+
+def test_different_products_stay_apart():
+    items = [item('Coke', 2.5), item('Coke Zero', 2.5), item('Pizza Hawaii', 10.0), item('Pizza Funghi', 10.0)]
+    assert names(dedupe_menu_items(items)) == ['Coke', 'Coke Zero', 'Pizza Hawaii', 'Pizza Funghi']
+
+
+def test_first_occurrence_order_is_kept():
+    items = [item('Fries', 3.0), item('Soup', 5.0), item('fries', 3.0), item('Soup', 5.0), item('Wrap', 7.0)]
+    assert names(dedupe_menu_items(items)) == ['Fries', 'Soup', 'Wrap']
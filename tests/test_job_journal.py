@@ -0,0 +1,37 @@
+"""
+Only the newest unfinished job is offered for resume, decided from its status file
+"""
+
+import os
+
+from storage import JobJournal
+
+
+def test_finished_job_is_not_offered(tmp_path):
+    journal = JobJournal.create(str(tmp_path), city='maastricht')
+    assert JobJournal.latest_unfinished(str(tmp_path)).path == journal.path
+
+    journal.finish()
+    assert JobJournal.latest_unfinished(str(tmp_path)) is None
+
+
+def test_new_job_supersedes_unfinished_one(tmp_path):
+    stale = JobJournal.create(str(tmp_path), city='maastricht')
+    stale.record_discovered(['a', 'b'])
+    stale.record_result('a', None)
+
+    newest = JobJournal.create(str(tmp_path), city='maastricht')
+    newest.finish()
+
+    assert stale.status() == JobJournal.SUPERSEDED
+    assert stale.load()['superseded']
+    assert JobJournal.latest_unfinished(str(tmp_path)) is None
+
+
+def test_status_is_recovered_from_journal_without_status_file(tmp_path):
+    journal = JobJournal.create(str(tmp_path), city='maastricht')
+    journal.finish()
+    os.remove(f"{os.path.splitext(journal.path)[0]}.status")
+
+    assert JobJournal.latest_unfinished(str(tmp_path)) is None
+    assert journal.status() == JobJournal.FINISHED
@@ -0,0 +1,60 @@
+"""
+A changed scraped_menus.json is merged into the log, never replacing it
+"""
+
+import json
+import os
+
+from storage import RestaurantStore, write_json_array
+
+
+def restaurant(url, scraped_at, price=10.0):
+    return {'url': url, 'restaurant_name': url, 'scraped_at': scraped_at,
+            'menu_items': [{'name': 'Pizza', 'price': price}]}
+
+
+def latest(store):
+    return {record['url']: record for record in store.latest()}
+
+
+def test_first_use_imports_snapshot(tmp_path):
+    snapshot = tmp_path / 'scraped_menus.json'
+    write_json_array([restaurant('a', '2024-01-01'), restaurant('b', '2024-01-01')], snapshot)
+
+    store = RestaurantStore(str(tmp_path / 'scraped_menus.jsonl'), seed_from=str(snapshot))
+    assert set(latest(store)) == {'a', 'b'}
+
+
+def test_changed_snapshot_keeps_newer_log_records(tmp_path):
+    log = str(tmp_path / 'scraped_menus.jsonl')
+    snapshot = tmp_path / 'scraped_menus.json'
+    write_json_array([restaurant('a', '2024-01-01'), restaurant('b', '2024-01-01')], snapshot)
+    store = RestaurantStore(log, seed_from=str(snapshot))
+
+    # Appended by a scrape that never compacted
+    store.append(restaurant('a', '2024-02-01', price=12.0))
+    store.append(restaurant('c', '2024-02-01'))
+
+    # The snapshot changes underneath (e.g. git pull): older 'a', newer 'b', new 'd'
+    write_json_array([restaurant('a', '2024-01-15', price=11.0), restaurant('b', '2024-03-01', price=13.0),
+                      restaurant('d', '2024-01-01')], snapshot)
+    os.utime(snapshot, ns=(os.stat(log).st_mtime_ns + 10**9,) * 2)
+
+    records = latest(RestaurantStore(log, seed_from=str(snapshot)))
+    assert set(records) == {'a', 'b', 'c', 'd'}
+    assert records['a']['menu_items'][0]['price'] == 12.0
+    assert records['b']['menu_items'][0]['price'] == 13.0
+
+
+def test_unchanged_snapshot_is_not_merged_again(tmp_path):
+    log = str(tmp_path / 'scraped_menus.jsonl')
+    snapshot = str(tmp_path / 'scraped_menus.json')
+    write_json_array([restaurant('a', '2024-01-01')], snapshot)
+    RestaurantStore(log, seed_from=snapshot)
+    RestaurantStore(log, seed_from=snapshot).compact(snapshot)
+
+    with open(log, 'r', encoding='utf-8') as f:
+        lines = [json.loads(line) for line in f]
+    RestaurantStore(log, seed_from=snapshot)
+    with open(log, 'r', encoding='utf-8') as f:
+        assert [json.loads(line) for line in f] == lines